@@ -0,0 +1,271 @@
+# Benchmark de tempo, memória e precisão dos métodos de sistemas lineares.
+# Os resultados são comparados com benchmark_baseline.json (versionado junto);
+# os tempos dependem da máquina, então regrave a baseline localmente antes de
+# comparar:  python benchmark.py --salvar-baseline
+
+import argparse
+import json
+import os
+import random
+import time
+import tracemalloc
+from math import sqrt
+
+from resposta import Matrix
+from iterativos import gauss_seidel, gradiente_conjugado
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+# Maior n resolvido com Fraction (backend 'exato' e solução de referência): o custo
+# de Bareiss cresce rápido demais acima disso (segundos já em n=80)
+N_MAX_EXATO = 40
+
+
+# ------------------------------------------------------------------
+# Geradores de matrizes (todos determinísticos a partir da semente)
+
+def aleatoria(n, rng):
+    """Matriz densa com entradas uniformes em [-1, 1]."""
+    return [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+
+
+def diagonal_dominante(n, rng):
+    """Matriz estritamente diagonal dominante por linhas."""
+    A = aleatoria(n, rng)
+    for i in range(n):
+        A[i][i] = sum(abs(x) for x in A[i]) + 1.0
+    return A
+
+
+def spd(n, rng):
+    """Matriz simétrica positiva definida (B^T B + n I)."""
+    B = aleatoria(n, rng)
+    return [[sum(B[k][i] * B[k][j] for k in range(n)) + (n if i == j else 0)
+             for j in range(n)] for i in range(n)]
+
+
+def hilbert(n, rng):
+    """Matriz de Hilbert, exemplo clássico de mau condicionamento."""
+    return [[1.0 / (i + j + 1) for j in range(n)] for i in range(n)]
+
+
+def banda(n, rng, largura=2):
+    """Matriz de banda diagonal dominante com a largura indicada."""
+    A = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(max(0, i - largura), min(n, i + largura + 1)):
+            A[i][j] = rng.uniform(-1, 1)
+        A[i][i] = sum(abs(x) for x in A[i]) + 1.0
+    return A
+
+
+def quase_singular(n, rng):
+    """Matriz aleatória cuja última linha é quase combinação das anteriores."""
+    A = aleatoria(n, rng)
+    A[-1] = [A[0][j] + A[1 % n][j] + 1e-10 * rng.uniform(-1, 1) for j in range(n)]
+    return A
+
+
+GERADORES = {
+    'aleatoria': aleatoria,
+    'diagonal_dominante': diagonal_dominante,
+    'spd': spd,
+    'hilbert': hilbert,
+    'banda': banda,
+    'quase_singular': quase_singular,
+}
+
+
+# ------------------------------------------------------------------
+# Backends: cada um recebe (A, b) e devolve x; flops é uma estimativa
+
+def _gauss_jordan(A, b):
+    return Matrix([row + [bi] for row, bi in zip(A, b)]).solve(inplace=True)
+
+
+def _refinado(A, b):
+    return Matrix([row + [bi] for row, bi in zip(A, b)]).solve_refined()
+
+
+def _exato(A, b):
+    return [float(v) for v in Matrix([row + [bi] for row, bi in zip(A, b)]).solve_exact()]
+
+
+def _gauss_seidel(A, b):
+    return gauss_seidel(A, b, tol=1e-12, max_iter=500).x
+
+
+def _gradiente_conjugado(A, b):
+    return gradiente_conjugado(A, b, tol=1e-12, max_iter=10 * len(A)).x
+
+
+# (função, estimativa de flops, tipos de matriz aceitos ou None para todos, n máximo)
+BACKENDS = {
+    'gauss_jordan': (_gauss_jordan, lambda n: n ** 3, None, None),
+    'refinado': (_refinado, lambda n: 2 * n ** 3 / 3, None, None),
+    'exato': (_exato, lambda n: 2 * n ** 3 / 3, None, N_MAX_EXATO),
+    'gauss_seidel': (_gauss_seidel, lambda n: 2 * n ** 2, {'diagonal_dominante', 'banda'}, None),
+    'gradiente_conjugado': (_gradiente_conjugado, lambda n: 2 * n ** 2, {'spd'}, None),
+}
+
+
+def _norma(v):
+    return sqrt(sum(x * x for x in v))
+
+
+def sistema(A, x_true):
+    """
+    Monta o sistema de teste e a solução de referência.
+    b = A x_true é arredondado para float, então x_true não é a solução exata do
+    sistema que os métodos recebem; até N_MAX_EXATO a referência é a solução exata
+    (Bareiss) de A x = b com esse b, para que o erro medido seja do método e não do
+    condicionamento do problema. Acima disso usa x_true, e o erro inclui o efeito
+    do arredondamento de b.
+    :return: (b, x_ref).
+    """
+    n = len(A)
+    b = [sum(A[i][j] * x_true[j] for j in range(n)) for i in range(n)]
+    if n > N_MAX_EXATO:
+        return b, list(x_true)
+    try:
+        x_ref = [float(v) for v in Matrix([row + [bi] for row, bi in zip(A, b)]).solve_exact()]
+    except (ValueError, ZeroDivisionError):
+        x_ref = list(x_true)  # singular em aritmética exata: não há referência melhor
+    return b, x_ref
+
+
+def medir(A, b, x_ref, funcao, repeticoes=3, tempo_minimo=0.01):
+    """
+    Executa um backend e mede tempo, memória de pico e precisão.
+    :param A: Matriz de coeficientes.
+    :param b: Termos independentes.
+    :param x_ref: Solução exata de A x = b (ver sistema).
+    :param funcao: Backend (A, b) -> x.
+    :param repeticoes: Número de amostras; o tempo reportado é o menor.
+    :param tempo_minimo: Cada amostra repete o backend até somar pelo menos este
+                         tempo (em segundos) e reporta a média por execução, para
+                         que casos de microssegundos não fiquem no ruído do relógio.
+    :return: Dicionário com tempo, memoria, residuo e erro.
+    """
+    n = len(A)
+    inicio = time.perf_counter()
+    x = funcao([row[:] for row in A], b)
+    laco = max(1, int(tempo_minimo / max(time.perf_counter() - inicio, 1e-9)) + 1)
+    tempo = float('inf')
+    for _ in range(repeticoes):
+        copias = [[row[:] for row in A] for _ in range(laco)]
+        inicio = time.perf_counter()
+        for copia in copias:
+            funcao(copia, b)
+        tempo = min(tempo, (time.perf_counter() - inicio) / laco)
+    tracemalloc.start()
+    funcao([row[:] for row in A], b)
+    memoria = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    r = [b[i] - sum(A[i][j] * x[j] for j in range(n)) for i in range(n)]
+    erro = [x[i] - x_ref[i] for i in range(n)]
+    return {
+        'tempo': tempo,
+        'memoria': memoria,
+        'residuo': _norma(r),
+        'erro': _norma(erro) / _norma(x_ref),
+    }
+
+
+def executar(tamanhos, tipos, backends, semente=0, repeticoes=3):
+    """
+    Executa a suíte completa.
+    :return: Dicionário {"tipo/backend/n": métricas}.
+    """
+    resultados = {}
+    for tipo in tipos:
+        for n in tamanhos:
+            rng = random.Random(f"{semente}-{tipo}-{n}")
+            A = GERADORES[tipo](n, rng)
+            x_true = [rng.uniform(-1, 1) for _ in range(n)]
+            b, x_ref = sistema(A, x_true)
+            for nome in backends:
+                funcao, flops, aceitos, n_max = BACKENDS[nome]
+                if (aceitos is not None and tipo not in aceitos) or (n_max is not None and n > n_max):
+                    continue
+                try:
+                    m = medir(A, b, x_ref, funcao, repeticoes)
+                except (ValueError, ArithmeticError) as e:
+                    m = {'falha': str(e)}
+                else:
+                    m['flops'] = flops(n) / m['tempo'] if m['tempo'] > 0 else 0.0
+                resultados[f"{tipo}/{nome}/{n}"] = m
+    return resultados
+
+
+def comparar(resultados, baseline, limite_tempo=1.5, limite_erro=10.0, piso_tempo=1e-3):
+    """
+    Compara os resultados com a baseline e lista as regressões.
+    :param limite_tempo: Razão de tempo acima da qual há regressão.
+    :param piso_tempo: Diferenças de tempo menores que isto (segundos) são ruído e ignoradas.
+    :param limite_erro: Razão de erro/resíduo acima da qual há regressão.
+    :return: Lista de strings descrevendo as regressões.
+    """
+    regressoes = []
+    for chave, m in resultados.items():
+        base = baseline.get(chave)
+        if base is None or 'falha' in base:
+            continue
+        if 'falha' in m:
+            regressoes.append(f"{chave}: falhou ({m['falha']})")
+            continue
+        if m['tempo'] > limite_tempo * base['tempo'] and m['tempo'] - base['tempo'] > piso_tempo:
+            regressoes.append(f"{chave}: tempo {base['tempo']:.4f}s -> {m['tempo']:.4f}s")
+        for metrica in ('residuo', 'erro'):
+            # Ignora variações abaixo da precisão de máquina
+            if m[metrica] > limite_erro * max(base[metrica], 1e-15):
+                regressoes.append(f"{chave}: {metrica} {base[metrica]:.2e} -> {m[metrica]:.2e}")
+    return regressoes
+
+
+def formatar(resultados):
+    """
+    Formata os resultados como tabela de texto.
+    """
+    linhas = [f"{'caso':<40}{'tempo (s)':>12}{'Mflop/s':>10}{'pico (KiB)':>12}{'residuo':>11}{'erro':>11}"]
+    for chave, m in resultados.items():
+        if 'falha' in m:
+            linhas.append(f"{chave:<40}  falha: {m['falha']}")
+        else:
+            linhas.append(f"{chave:<40}{m['tempo']:>12.5f}{m['flops'] / 1e6:>10.2f}"
+                          f"{m['memoria'] / 1024:>12.1f}{m['residuo']:>11.2e}{m['erro']:>11.2e}")
+    return '\n'.join(linhas)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark e precisão dos métodos de sistemas lineares.")
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10, 20, 40])
+    parser.add_argument('--tipos', nargs='+', default=list(GERADORES), choices=list(GERADORES))
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--baseline', default=BASELINE, help="Arquivo JSON da baseline.")
+    parser.add_argument('--salvar-baseline', action='store_true', help="Grava os resultados como nova baseline.")
+    parser.add_argument('--limite-tempo', type=float, default=1.5, help="Razão de tempo que conta como regressão.")
+    parser.add_argument('--piso-tempo', type=float, default=1e-3,
+                        help="Diferença mínima de tempo (s) para contar como regressão.")
+    args = parser.parse_args()
+
+    resultados = executar(args.tamanhos, args.tipos, args.backends, args.semente, args.repeticoes)
+    print(formatar(resultados))
+
+    if args.salvar_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(resultados, f, indent=2)
+        print(f"\nBaseline gravada em {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressoes = comparar(resultados, json.load(f), args.limite_tempo, piso_tempo=args.piso_tempo)
+        if regressoes:
+            print("\nRegressões em relação à baseline:")
+            for r in regressoes:
+                print("  " + r)
+            raise SystemExit(1)
+        print("\nSem regressões em relação à baseline.")
+    else:
+        print(f"\nSem baseline em {args.baseline}; grave uma com --salvar-baseline.")
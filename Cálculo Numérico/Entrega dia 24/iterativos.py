@@ -0,0 +1,282 @@
+from math import sqrt
+
+
+class ResultadoIterativo:
+    def __init__(self, x, iteracoes, residuo, convergiu):
+        """
+        Resultado de um método iterativo.
+        :param x: Vetor solução aproximado.
+        :param iteracoes: Número de iterações executadas.
+        :param residuo: Norma euclidiana do resíduo ||b - Ax|| final.
+        :param convergiu: True se a tolerância foi atingida.
+        """
+        self.x = x
+        self.iteracoes = iteracoes
+        self.residuo = residuo
+        self.convergiu = convergiu
+
+    def __repr__(self):
+        return (f"ResultadoIterativo(iteracoes={self.iteracoes}, "
+                f"residuo={self.residuo:.3e}, convergiu={self.convergiu})")
+
+
+def _linhas_esparsas(A):
+    """
+    Converte a matriz de coeficientes para uma lista de linhas esparsas.
+    Aceita uma instância de Matrix, uma lista de listas (densa) ou uma lista
+    de dicionários {coluna: valor} (esparsa).
+    :param A: Matriz de coeficientes.
+    :return: (linhas, diagonal) onde linhas[i] = [(j, a_ij), ...] sem zeros.
+    """
+    data = getattr(A, 'data', A)
+    linhas = []
+    for row in data:
+        if isinstance(row, dict):
+            itens = sorted(row.items())
+        else:
+            itens = enumerate(row)
+        linhas.append([(j, a) for j, a in itens if a != 0])
+    n = len(linhas)
+    diagonal = [0.0] * n
+    for i, row in enumerate(linhas):
+        for j, a in row:
+            if j == i:
+                diagonal[i] = a
+        if diagonal[i] == 0:
+            raise ValueError("Elemento nulo na diagonal principal!")
+    return linhas, diagonal
+
+
+def _residuo(linhas, b, x):
+    """
+    Calcula a norma euclidiana de b - Ax.
+    """
+    total = 0.0
+    for i, row in enumerate(linhas):
+        r = b[i]
+        for j, a in row:
+            r -= a * x[j]
+        total += r * r
+    return sqrt(total)
+
+
+def _iterar(linhas, b, x, passo, tol, max_iter, callback):
+    """
+    Laço comum aos métodos estacionários (Jacobi, Gauss-Seidel e SOR).
+    :param passo: Função que recebe x e devolve a próxima aproximação.
+    """
+    residuo = _residuo(linhas, b, x)
+    if residuo <= tol:
+        return ResultadoIterativo(x, 0, residuo, True)
+    for k in range(1, max_iter + 1):
+        x = passo(x)
+        residuo = _residuo(linhas, b, x)
+        if callback is not None and callback(k, x, residuo):
+            return ResultadoIterativo(x, k, residuo, residuo <= tol)
+        if residuo <= tol:
+            return ResultadoIterativo(x, k, residuo, True)
+    return ResultadoIterativo(x, max_iter, residuo, False)
+
+
+def jacobi(A, b, x0=None, tol=1e-10, max_iter=1000, callback=None):
+    """
+    Resolve Ax = b pelo método de Jacobi.
+    Converge para matrizes estritamente diagonal dominantes.
+    :param A: Matriz de coeficientes (Matrix, lista de listas ou lista de dicionários).
+    :param b: Vetor dos termos independentes.
+    :param x0: Aproximação inicial (partida a quente); padrão é o vetor nulo.
+    :param tol: Tolerância para a norma do resíduo.
+    :param max_iter: Número máximo de iterações.
+    :param callback: Função callback(k, x, residuo) chamada a cada iteração;
+                     se retornar True, o método é interrompido.
+    :return: Instância de ResultadoIterativo.
+    """
+    linhas, diagonal = _linhas_esparsas(A)
+    n = len(linhas)
+    x = list(x0) if x0 is not None else [0.0] * n
+
+    def passo(x):
+        novo = [0.0] * n
+        for i, row in enumerate(linhas):
+            s = b[i]
+            for j, a in row:
+                if j != i:
+                    s -= a * x[j]
+            novo[i] = s / diagonal[i]
+        return novo
+
+    return _iterar(linhas, b, x, passo, tol, max_iter, callback)
+
+
+def sor(A, b, omega=1.5, x0=None, tol=1e-10, max_iter=1000, callback=None):
+    """
+    Resolve Ax = b pelo método SOR (sobre-relaxação sucessiva).
+    Com omega = 1 equivale ao método de Gauss-Seidel.
+    :param omega: Fator de relaxação, 0 < omega < 2.
+    :return: Instância de ResultadoIterativo.
+    Demais parâmetros como em jacobi.
+    """
+    if not 0 < omega < 2:
+        raise ValueError("O fator de relaxação deve estar no intervalo (0, 2)!")
+    linhas, diagonal = _linhas_esparsas(A)
+    n = len(linhas)
+    x = list(x0) if x0 is not None else [0.0] * n
+
+    def passo(x):
+        # Atualização no próprio vetor: usa os valores já calculados nesta iteração
+        x = x[:]
+        for i, row in enumerate(linhas):
+            s = b[i]
+            for j, a in row:
+                if j != i:
+                    s -= a * x[j]
+            x[i] += omega * (s / diagonal[i] - x[i])
+        return x
+
+    return _iterar(linhas, b, x, passo, tol, max_iter, callback)
+
+
+def gauss_seidel(A, b, x0=None, tol=1e-10, max_iter=1000, callback=None):
+    """
+    Resolve Ax = b pelo método de Gauss-Seidel.
+    Parâmetros como em jacobi.
+    :return: Instância de ResultadoIterativo.
+    """
+    return sor(A, b, 1.0, x0, tol, max_iter, callback)
+
+
+def _cholesky_incompleta(linhas):
+    """
+    Fatoração de Cholesky incompleta IC(0): L tem o mesmo padrão de esparsidade
+    da parte triangular inferior de A.
+    :param linhas: Linhas esparsas de A (simétrica positiva definida).
+    :return: Lista de dicionários com as linhas de L.
+    """
+    L = []
+    for i, row in enumerate(linhas):
+        Li = {}
+        for k, a in row:
+            if k >= i:
+                continue
+            Lk = L[k]
+            s = a
+            for j, lij in Li.items():
+                if j in Lk:
+                    s -= lij * Lk[j]
+            Li[k] = s / Lk[k]
+        s = dict(row).get(i, 0.0) - sum(v * v for v in Li.values())
+        if s <= 0:
+            raise ValueError("Fatoração incompleta falhou: matriz não é positiva definida!")
+        Li[i] = sqrt(s)
+        L.append(Li)
+    return L
+
+
+def _aplicar_cholesky(L, r):
+    """
+    Resolve (L L^T) z = r por substituição progressiva e regressiva.
+    """
+    n = len(L)
+    y = [0.0] * n
+    for i in range(n):
+        s = r[i]
+        for j, lij in L[i].items():
+            if j != i:
+                s -= lij * y[j]
+        y[i] = s / L[i][i]
+    for i in range(n - 1, -1, -1):
+        y[i] /= L[i][i]
+        for j, lij in L[i].items():
+            if j != i:
+                y[j] -= lij * y[i]
+    return y
+
+
+def gradiente_conjugado(A, b, x0=None, tol=1e-10, max_iter=None,
+                        precondicionador='jacobi', callback=None):
+    """
+    Resolve Ax = b pelo método do Gradiente Conjugado precondicionado.
+    A deve ser simétrica positiva definida.
+    :param precondicionador: 'jacobi' (diagonal), 'cholesky' (Cholesky
+                             incompleta IC(0)) ou None (sem precondicionador).
+    :param max_iter: Número máximo de iterações; padrão é a ordem da matriz.
+    :return: Instância de ResultadoIterativo.
+    Demais parâmetros como em jacobi.
+    """
+    linhas, diagonal = _linhas_esparsas(A)
+    n = len(linhas)
+    if max_iter is None:
+        max_iter = n
+    x = list(x0) if x0 is not None else [0.0] * n
+
+    if precondicionador is None:
+        def aplicar(r):
+            return r[:]
+    elif precondicionador == 'jacobi':
+        def aplicar(r):
+            return [r[i] / diagonal[i] for i in range(n)]
+    elif precondicionador == 'cholesky':
+        L = _cholesky_incompleta(linhas)
+
+        def aplicar(r):
+            return _aplicar_cholesky(L, r)
+    else:
+        raise ValueError(f"Precondicionador desconhecido: {precondicionador}")
+
+    def produto(v):
+        return [sum(a * v[j] for j, a in row) for row in linhas]
+
+    Ax = produto(x)
+    r = [b[i] - Ax[i] for i in range(n)]
+    residuo = sqrt(sum(v * v for v in r))
+    if residuo <= tol:
+        return ResultadoIterativo(x, 0, residuo, True)
+    z = aplicar(r)
+    p = z[:]
+    rz = sum(r[i] * z[i] for i in range(n))
+
+    for k in range(1, max_iter + 1):
+        Ap = produto(p)
+        alfa = rz / sum(p[i] * Ap[i] for i in range(n))
+        for i in range(n):
+            x[i] += alfa * p[i]
+            r[i] -= alfa * Ap[i]
+        residuo = sqrt(sum(v * v for v in r))
+        if callback is not None and callback(k, x, residuo):
+            return ResultadoIterativo(x, k, residuo, residuo <= tol)
+        if residuo <= tol:
+            return ResultadoIterativo(x, k, residuo, True)
+        z = aplicar(r)
+        rz_novo = sum(r[i] * z[i] for i in range(n))
+        beta = rz_novo / rz
+        rz = rz_novo
+        for i in range(n):
+            p[i] = z[i] + beta * p[i]
+
+    return ResultadoIterativo(x, max_iter, residuo, False)
+
+
+# Exemplo de uso:
+if __name__ == '__main__':
+    # Sistema diagonal dominante e simétrico positivo definido
+    A = [
+        [4.0, -1.0, 0.0],
+        [-1.0, 4.0, -1.0],
+        [0.0, -1.0, 4.0]
+    ]
+    b = [15.0, 10.0, 10.0]
+
+    print("Jacobi:", jacobi(A, b))
+    print("Gauss-Seidel:", gauss_seidel(A, b))
+    print("SOR (omega=1.1):", sor(A, b, omega=1.1))
+
+    def mostra(k, x, residuo):
+        print(f"  iteração {k}: resíduo {residuo:.3e}")
+
+    resultado = gradiente_conjugado(A, b, precondicionador='cholesky', callback=mostra)
+    print("Gradiente Conjugado:", resultado)
+    print("Solução:", [round(v, 3) for v in resultado.x])
+
+    # Mesma matriz em formato esparso (lista de dicionários)
+    A_esparsa = [{0: 4.0, 1: -1.0}, {0: -1.0, 1: 4.0, 2: -1.0}, {1: -1.0, 2: 4.0}]
+    print("Jacobi (esparsa):", [round(v, 3) for v in jacobi(A_esparsa, b).x])
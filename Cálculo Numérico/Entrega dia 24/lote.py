@@ -0,0 +1,176 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+from resposta import Matrix
+
+
+class ResultadoLote:
+    def __init__(self, indice, status, solucao=None, erro=None):
+        """
+        Resultado de um sistema resolvido em lote.
+        :param indice: Posição do sistema na entrada.
+        :param status: 'ok', 'singular' ou 'erro'.
+        :param solucao: Vetor solução (um termo independente) ou lista de linhas
+                        da matriz solução X (vários termos independentes).
+        :param erro: Mensagem de erro quando status != 'ok'.
+        """
+        self.indice = indice
+        self.status = status
+        self.solucao = solucao
+        self.erro = erro
+
+    def __repr__(self):
+        if self.status == 'ok':
+            return f"ResultadoLote({self.indice}, ok, {self.solucao})"
+        return f"ResultadoLote({self.indice}, {self.status}, {self.erro!r})"
+
+
+def aumentar(A, b):
+    """
+    Monta a matriz aumentada [A | b].
+    :param A: Matriz de coeficientes (lista de listas).
+    :param b: Vetor de termos independentes ou matriz com várias colunas.
+    :return: Matriz aumentada (lista de listas).
+    """
+    linhas = []
+    for row, bi in zip(A, b):
+        if isinstance(bi, (list, tuple)):
+            linhas.append(list(row) + list(bi))
+        else:
+            linhas.append(list(row) + [bi])
+    return linhas
+
+
+def _colunas(b):
+    """Número de colunas de um termo independente matricial; None se for vetor."""
+    primeiro = b[0] if len(b) else None
+    return len(primeiro) if isinstance(primeiro, (list, tuple)) else None
+
+
+def _resolver(indice, sistema, colunas=None):
+    """
+    Resolve um único sistema aumentado, convertendo as falhas em status.
+    :param colunas: Quantidade de termos independentes quando vieram de B como
+                    matriz; None quando há só a última coluna (vetor).
+    """
+    try:
+        data = getattr(sistema, 'data', sistema)
+        n = len(data)
+        esperado = n + (1 if colunas is None else colunas)
+        if any(len(row) != esperado for row in data):
+            return ResultadoLote(indice, 'erro', erro=f"Formato inválido: {n} equações pedem "
+                                 f"{esperado} colunas por linha (coeficientes quadrados + termos).")
+        reduzida = Matrix(data).gauss_jordan().data
+        if colunas is None:
+            solucao = [row[n] for row in reduzida]
+        else:
+            solucao = [row[n:] for row in reduzida]
+        return ResultadoLote(indice, 'ok', solucao)
+    except ValueError as e:
+        status = 'singular' if 'singular' in str(e) else 'erro'
+        return ResultadoLote(indice, status, erro=str(e))
+    except (ArithmeticError, IndexError, TypeError) as e:
+        return ResultadoLote(indice, 'erro', erro=str(e))
+
+
+def _resolver_bloco(inicio, bloco):
+    """
+    Resolve um bloco de sistemas; é a unidade de trabalho enviada aos workers.
+    """
+    return [_resolver(inicio + k, sistema, colunas) for k, (sistema, colunas) in enumerate(bloco)]
+
+
+def _blocos(sistemas, tamanho):
+    """
+    Divide o iterável de sistemas em blocos (inicio, lista) sem materializá-lo.
+    """
+    it = iter(sistemas)
+    inicio = 0
+    while True:
+        bloco = list(islice(it, tamanho))
+        if not bloco:
+            return
+        yield inicio, bloco
+        inicio += len(bloco)
+
+
+def solve_batch(sistemas, B=None, workers=None, chunk_size=None, processos=True):
+    """
+    Resolve muitos sistemas lineares independentes em um pool de workers.
+    Os resultados são devolvidos em ordem, à medida que ficam prontos, e uma
+    matriz singular não interrompe o lote: gera um resultado com status 'singular'.
+    :param sistemas: Iterável de matrizes aumentadas n x (n+1) (listas de listas ou
+                     Matrix) ou, se B for informado, pilha de matrizes de coeficientes.
+                     Outros formatos geram resultado com status 'erro'.
+    :param B: Pilha de termos independentes (vetores ou matrizes multi-RHS), com
+              o mesmo comprimento de sistemas; ValueError se os tamanhos diferirem.
+              Vários termos independentes só são aceitos por aqui.
+    :param workers: Número de workers; padrão é o número de CPUs.
+    :param chunk_size: Sistemas por tarefa enviada ao pool; padrão é escolhido
+                       a partir do tamanho da entrada para amortizar o despacho.
+    :param processos: Se True (padrão) usa ProcessPoolExecutor. A eliminação é
+                      Python puro e presa ao GIL, então ThreadPoolExecutor
+                      (processos=False) só ajuda quando a entrada vem de I/O
+                      (ex.: sistemas lidos de arquivos ou da rede sob demanda).
+    :return: Gerador de ResultadoLote, na ordem da entrada.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        try:
+            chunk_size = max(1, min(512, len(sistemas) // (workers * 4)))
+        except TypeError:
+            chunk_size = 64
+    if B is not None:
+        # Verificado já na chamada (e não na primeira iteração) quando há len()
+        if hasattr(sistemas, '__len__') and hasattr(B, '__len__') and len(sistemas) != len(B):
+            raise ValueError(f"{len(sistemas)} sistemas para {len(B)} termos independentes.")
+        # strict=True também detecta tamanhos diferentes em iteradores, ao chegar ao fim
+        sistemas = ((aumentar(A, b), _colunas(b)) for A, b in zip(sistemas, B, strict=True))
+    else:
+        sistemas = ((sistema, None) for sistema in sistemas)
+    return _solve_batch(sistemas, workers, chunk_size, processos)
+
+
+def _solve_batch(sistemas, workers, chunk_size, processos):
+    """
+    Gerador de solve_batch, separado para que os argumentos sejam validados na chamada.
+    """
+    if workers == 1:
+        for inicio, bloco in _blocos(sistemas, chunk_size):
+            yield from _resolver_bloco(inicio, bloco)
+        return
+
+    Executor = ProcessPoolExecutor if processos else ThreadPoolExecutor
+    with Executor(max_workers=workers) as pool:
+        # Mantém apenas alguns blocos em voo para não ler toda a entrada de uma vez
+        pendentes = deque()
+        for inicio, bloco in _blocos(sistemas, chunk_size):
+            pendentes.append(pool.submit(_resolver_bloco, inicio, bloco))
+            if len(pendentes) >= workers * 2:
+                yield from pendentes.popleft().result()
+        while pendentes:
+            yield from pendentes.popleft().result()
+
+
+# Exemplo de uso:
+if __name__ == '__main__':
+    sistemas = [
+        [[3.0, 2.0, -4.0, 3.0],
+         [2.0, 3.0, 3.0, 15.0],
+         [5.0, -3.0, 1.0, 14.0]],
+        [[1.0, 2.0, 3.0],
+         [2.0, 4.0, 6.0]],
+        [[2, 3, 5],
+         [4, -1, 7]],
+    ]
+    for resultado in solve_batch(sistemas, workers=2):
+        print(resultado)
+
+    # Pilha (A, B) com dois termos independentes por sistema
+    A = [[[2.0, 1.0], [1.0, 3.0]]] * 3
+    B = [[[3.0, 1.0], [5.0, 0.0]]] * 3
+    for resultado in solve_batch(A, B, workers=2, processos=True):
+        print(resultado)
@@ -1,3 +1,7 @@
+import warnings
+from fractions import Fraction
+
+
 class Matrix:
     def __init__(self, data):
         """
@@ -8,13 +12,23 @@ class Matrix:
         self.rows = len(data)
         self.cols = len(data[0]) if data else 0
 
+    def format_matrix(self, decimals=3):
+        """
+        Formata a matriz como texto, uma linha por linha da matriz.
+        :param decimals: Número de casas decimais para arredondamento.
+        :return: String com a matriz formatada.
+        """
+        return format_rows(self.data, decimals)
+
     def print_matrix(self, decimals=3):
         """
         Imprime a matriz, linha por linha, com os números arredondados.
         :param decimals: Número de casas decimais para arredondamento.
         """
-        for row in self.data:
-            print([round(x, decimals) for x in row])
+        print(self.format_matrix(decimals))
+
+    def __str__(self):
+        return self.format_matrix()
 
     @staticmethod
     def zeros(rows, cols):
@@ -33,36 +47,34 @@ class Matrix:
         """
         return Matrix([row[:-1] for row in self.data])
 
-    def determinant(self):
+    def coef_view(self):
+        """
+        Visão da matriz de coeficientes de uma matriz aumentada, sem copiar dados.
+        :return: MatrixView com todas as colunas exceto a última.
+        """
+        return MatrixView(self, 0, self.cols - 1)
+
+    def col_view(self, start, stop=None):
+        """
+        Visão das colunas [start, stop) da matriz, sem copiar dados.
+        :param start: Primeira coluna da visão.
+        :param stop: Coluna final (exclusiva); padrão é a última coluna.
+        :return: MatrixView que compartilha as linhas desta matriz.
+        """
+        return MatrixView(self, start, self.cols if stop is None else stop)
+
+    def determinant(self, inplace=False):
         """
         Calcula o determinante da matriz a partir da forma triangular superior.
         O produto dos elementos da diagonal principal é o determinante.
+        :param inplace: Se True, triangulariza a própria matriz em vez de uma cópia.
         :return: Determinante da matriz.
         """
         if self.rows != self.cols:
             raise ValueError("Determinante definido apenas para matrizes quadradas!")
-        n = self.rows
-        # Cria uma cópia para evitar modificar a matriz original
-        AM = [row[:] for row in self.data]
-        
-        for fd in range(n):
-            if AM[fd][fd] == 0:
-                for j in range(fd + 1, n):
-                    if AM[j][fd] != 0:
-                        AM[fd], AM[j] = AM[j], AM[fd]
-                        break
-                else:
-                    raise ValueError("Matriz singular!")
-            
-            for i in range(fd + 1, n):
-                crScaler = AM[i][fd] / AM[fd][fd]
-                for j in range(n):
-                    AM[i][j] -= crScaler * AM[fd][j]
-        
-        product = 1.0
-        for i in range(n):
-            product *= AM[i][i]
-        return product
+        # Sem inplace, trabalha numa cópia para não modificar a matriz original
+        AM = self.data if inplace else [row[:] for row in self.data]
+        return _determinant(AM, self.rows)
 
     def verifica_non_singularidade(self):
         """
@@ -74,14 +86,15 @@ class Matrix:
         else:
             raise ArithmeticError("Matriz Singular!")
 
-    def gauss_jordan(self):
+    def gauss_jordan(self, inplace=False):
         """
         Aplica o método de Gauss-Jordan para resolver o sistema linear.
         Supõe que a última coluna é o vetor de termos independentes.
-        :return: Nova instância de Matrix com a matriz aumentada transformada.
+        :param inplace: Se True, transforma a própria matriz e a retorna.
+        :return: Instância de Matrix com a matriz aumentada transformada.
         """
-        # Cria uma cópia da matriz aumentada
-        augMat = [row[:] for row in self.data]
+        # Sem inplace, trabalha numa cópia da matriz aumentada
+        augMat = self.data if inplace else [row[:] for row in self.data]
         n = len(augMat)
         m = len(augMat[0])
         
@@ -104,7 +117,309 @@ class Matrix:
                     for k in range(m):
                         augMat[j][k] -= coef * augMat[i][k]
         
-        return Matrix(augMat)
+        return self if inplace else Matrix(augMat)
+
+    def solve(self, inplace=False, mode='float'):
+        """
+        Resolve o sistema representado pela matriz aumentada.
+        :param inplace: Se True, a eliminação é feita na própria matriz (modo 'float').
+        :param mode: 'float' (Gauss-Jordan em ponto flutuante), 'exact'
+                     (solve_exact) ou 'refined' (solve_refined).
+        :return: Lista com a solução.
+        """
+        if mode == 'exact':
+            return self.solve_exact()
+        if mode == 'refined':
+            return self.solve_refined()
+        if mode != 'float':
+            raise ValueError(f"Modo desconhecido: {mode}")
+        return [row[-1] for row in self.gauss_jordan(inplace).data]
+
+    def solve_exact(self):
+        """
+        Resolve o sistema de forma exata com frações, usando a eliminação de
+        Bareiss (livre de frações) para evitar o crescimento dos coeficientes.
+        Cada linha é escalada para inteiros antes da eliminação.
+        :return: Lista de Fraction com a solução exata.
+        """
+        n = self.rows
+        M = _bareiss([_integer_row(row) for row in self.data], n)[0]
+        # Substituição regressiva sobre a forma triangular inteira
+        x = [Fraction(0)] * n
+        for i in range(n - 1, -1, -1):
+            s = Fraction(M[i][n])
+            for j in range(i + 1, n):
+                s -= M[i][j] * x[j]
+            x[i] = s / M[i][i]
+        return x
+
+    def determinant_exact(self):
+        """
+        Calcula o determinante exato pela eliminação de Bareiss.
+        :return: Fraction com o determinante.
+        """
+        if self.rows != self.cols:
+            raise ValueError("Determinante definido apenas para matrizes quadradas!")
+        n = self.rows
+        rows = [[Fraction(x) for x in row] for row in self.data]
+        # Escala cada linha para inteiros e desfaz a escala no final
+        scale = Fraction(1)
+        int_rows = []
+        for row in rows:
+            factor = _lcm_denominators(row)
+            scale *= factor
+            int_rows.append([int(x * factor) for x in row])
+        try:
+            M, sign = _bareiss(int_rows, n)
+        except ValueError:
+            return Fraction(0)
+        return Fraction(sign * M[n - 1][n - 1]) / scale
+
+    def solve_refined(self, tol=1e-15, max_iter=10):
+        """
+        Resolve o sistema em precisão mista: fatora a matriz de coeficientes
+        em ponto flutuante (LU com pivotamento parcial) uma única vez e refina
+        a solução calculando o resíduo exatamente com Fraction.
+        Uma correção só é aplicada se for menor que metade da anterior (a primeira,
+        menor que metade da solução); caso contrário a matriz é mal condicionada
+        demais para a fatoração em float, o refinamento divergiria e ele para,
+        mantendo a última solução aceita (nunca pior que a resolução sem refino).
+        Se não convergir, emite RuntimeWarning.
+        :param tol: Tolerância relativa para a correção.
+        :param max_iter: Número máximo de passos de refinamento.
+        :return: Lista de floats com a solução refinada.
+        """
+        n = self.rows
+        A = [[Fraction(x) for x in row[:n]] for row in self.data]
+        b = [Fraction(row[n]) for row in self.data]
+        LU, perm = _lu_decompose([[float(x) for x in row[:n]] for row in self.data])
+        x = [Fraction(v) for v in _lu_solve(LU, perm, [float(v) for v in b])]
+        anterior = None  # norma da última correção aplicada
+        convergiu = False
+        for _ in range(max_iter):
+            r = [b[i] - sum(A[i][j] * x[j] for j in range(n)) for i in range(n)]
+            if not any(r):
+                convergiu = True
+                break
+            d = _lu_solve(LU, perm, [float(v) for v in r])
+            norma = max(abs(v) for v in d)
+            if anterior is None:
+                anterior = max(abs(float(v)) for v in x)
+            if not norma <= anterior / 2:
+                break  # a correção não encolheu: aplicá-la pioraria x
+            x = [x[i] + Fraction(d[i]) for i in range(n)]
+            anterior = norma
+            if norma <= tol * max(abs(float(v)) for v in x):
+                convergiu = True
+                break
+        if not convergiu:
+            warnings.warn("solve_refined não convergiu: matriz mal condicionada para a "
+                          "fatoração em float ou max_iter insuficiente.", RuntimeWarning, stacklevel=2)
+        return [float(v) for v in x]
+
+
+class MatrixView:
+    def __init__(self, matrix, col_start, col_stop):
+        """
+        Visão de um bloco de colunas de uma Matrix. Compartilha a lista de linhas
+        da matriz original: alterações (inclusive trocas de linhas) aparecem nas duas.
+        :param matrix: Matrix original.
+        :param col_start: Primeira coluna da visão.
+        :param col_stop: Coluna final (exclusiva).
+        """
+        self.base = matrix.data
+        self.col_start = col_start
+        self.col_stop = col_stop
+        self.rows = len(self.base)
+        self.cols = col_stop - col_start
+
+    def __getitem__(self, index):
+        i, j = index
+        return self.base[i][self.col_start + j]
+
+    def __setitem__(self, index, value):
+        i, j = index
+        self.base[i][self.col_start + j] = value
+
+    def row(self, i):
+        """
+        Retorna a linha i da visão (cópia apenas dessa linha).
+        """
+        return self.base[i][self.col_start:self.col_stop]
+
+    def to_matrix(self):
+        """
+        Copia a visão para uma nova instância de Matrix.
+        """
+        return Matrix([self.row(i) for i in range(self.rows)])
+
+    def determinant(self):
+        """
+        Calcula o determinante do bloco, copiando-o apenas uma vez para a eliminação.
+        :return: Determinante do bloco.
+        """
+        if self.rows != self.cols:
+            raise ValueError("Determinante definido apenas para matrizes quadradas!")
+        return _determinant([self.row(i) for i in range(self.rows)], self.rows)
+
+    def verifica_non_singularidade(self):
+        """
+        Verifica se o bloco é não singular (determinante diferente de zero).
+        :return: True se não singular, senão levanta ArithmeticError.
+        """
+        if self.determinant() != 0:
+            return True
+        else:
+            raise ArithmeticError("Matriz Singular!")
+
+    def format_matrix(self, decimals=3):
+        """
+        Formata o bloco como texto.
+        """
+        return format_rows((self.row(i) for i in range(self.rows)), decimals)
+
+    def print_matrix(self, decimals=3):
+        """
+        Imprime o bloco, linha por linha, com os números arredondados.
+        """
+        print(self.format_matrix(decimals))
+
+    def __str__(self):
+        return self.format_matrix()
+
+
+def format_rows(rows, decimals=3):
+    """
+    Formata linhas de uma matriz como texto, com os números arredondados.
+    :param rows: Iterável de linhas.
+    :param decimals: Número de casas decimais para arredondamento.
+    :return: String com uma linha de texto por linha da matriz.
+    """
+    return '\n'.join(str([round(x, decimals) for x in row]) for row in rows)
+
+
+def _lcm_denominators(row):
+    """
+    Menor múltiplo comum dos denominadores de uma linha de frações.
+    """
+    factor = 1
+    for x in row:
+        d = x.denominator
+        a, b = factor, d
+        while b:
+            a, b = b, a % b
+        factor = factor * d // a
+    return factor
+
+
+def _integer_row(row):
+    """
+    Converte uma linha para inteiros multiplicando pelo MMC dos denominadores.
+    Escalar uma linha da matriz aumentada não altera a solução do sistema.
+    """
+    row = [Fraction(x) for x in row]
+    factor = _lcm_denominators(row)
+    return [int(x * factor) for x in row]
+
+
+def _bareiss(M, n):
+    """
+    Eliminação de Bareiss (livre de frações) sobre uma matriz de inteiros.
+    Todas as divisões são exatas, então os coeficientes permanecem inteiros.
+    :param M: Lista de listas de inteiros (será modificada).
+    :param n: Número de linhas/colunas pivô.
+    :return: (M triangular superior, sinal das trocas de linhas).
+    """
+    sign = 1
+    prev = 1
+    for k in range(n):
+        if M[k][k] == 0:
+            for j in range(k + 1, n):
+                if M[j][k] != 0:
+                    M[k], M[j] = M[j], M[k]
+                    sign = -sign
+                    break
+            else:
+                raise ValueError("Matriz singular!")
+        pivot = M[k][k]
+        for i in range(k + 1, n):
+            Mi = M[i]
+            Mk = M[k]
+            factor = Mi[k]
+            for j in range(k + 1, len(Mi)):
+                Mi[j] = (Mi[j] * pivot - factor * Mk[j]) // prev
+            Mi[k] = 0
+        prev = pivot
+    return M, sign
+
+
+def _lu_decompose(A):
+    """
+    Fatoração LU com pivotamento parcial em ponto flutuante (PA = LU).
+    L e U são guardadas na mesma matriz (diagonal de L implícita igual a 1).
+    :param A: Matriz quadrada (lista de listas, será modificada).
+    :return: (LU, permutação das linhas).
+    """
+    n = len(A)
+    perm = list(range(n))
+    for k in range(n):
+        p = max(range(k, n), key=lambda i: abs(A[i][k]))
+        if A[p][k] == 0:
+            raise ValueError("Matriz singular!")
+        if p != k:
+            A[k], A[p] = A[p], A[k]
+            perm[k], perm[p] = perm[p], perm[k]
+        for i in range(k + 1, n):
+            A[i][k] /= A[k][k]
+            f = A[i][k]
+            for j in range(k + 1, n):
+                A[i][j] -= f * A[k][j]
+    return A, perm
+
+
+def _lu_solve(LU, perm, b):
+    """
+    Resolve LUx = Pb por substituição progressiva e regressiva.
+    """
+    n = len(LU)
+    y = [b[p] for p in perm]
+    for i in range(n):
+        for j in range(i):
+            y[i] -= LU[i][j] * y[j]
+    for i in range(n - 1, -1, -1):
+        for j in range(i + 1, n):
+            y[i] -= LU[i][j] * y[j]
+        y[i] /= LU[i][i]
+    return y
+
+
+def _determinant(AM, n):
+    """
+    Triangulariza AM no próprio lugar e retorna o produto da diagonal principal.
+    :param AM: Lista de listas (será modificada).
+    :param n: Ordem da matriz.
+    :return: Determinante.
+    """
+    sign = 1.0
+    for fd in range(n):
+        if AM[fd][fd] == 0:
+            for j in range(fd + 1, n):
+                if AM[j][fd] != 0:
+                    AM[fd], AM[j] = AM[j], AM[fd]
+                    sign = -sign  # cada troca de linhas inverte o sinal
+                    break
+            else:
+                raise ValueError("Matriz singular!")
+        
+        for i in range(fd + 1, n):
+            crScaler = AM[i][fd] / AM[fd][fd]
+            for j in range(n):
+                AM[i][j] -= crScaler * AM[fd][j]
+    
+    product = sign
+    for i in range(n):
+        product *= AM[i][i]
+    return product
 
 
 # Exemplo de uso:
@@ -122,8 +437,8 @@ if __name__ == '__main__':
     
     matrix = Matrix(matriz_aumentada)
     
-    # Recupera a matriz de coeficientes
-    mc = matrix.coef_matrix()
+    # Recupera a matriz de coeficientes (visão sem cópia)
+    mc = matrix.coef_view()
     print("Matriz de Coeficientes:")
     mc.print_matrix()
     
@@ -138,3 +453,7 @@ if __name__ == '__main__':
     result = matrix.gauss_jordan()
     print("Matriz após Gauss-Jordan:")
     result.print_matrix()
+
+    # Determinante com troca de linhas: o cálculo em ponto flutuante e o exato coincidem
+    pivotada = Matrix([[0, 2, 1], [1, 1, 0], [3, 0, 4]])
+    print("Determinante com pivoteamento:", pivotada.determinant(), "=", pivotada.determinant_exact())
@@ -0,0 +1,46 @@
+# Testes de resposta.py: determinante com pivoteamento e convergência do refinamento.
+
+import random
+import warnings
+
+import pytest
+
+from resposta import Matrix, _lu_decompose, _lu_solve
+
+
+def hilbert_aumentada(n, semente=0):
+    """Sistema de Hilbert n x n com b = A x para x aleatório em [-1, 1]."""
+    rng = random.Random(semente)
+    A = [[1.0 / (i + j + 1) for j in range(n)] for i in range(n)]
+    x = [rng.uniform(-1, 1) for _ in range(n)]
+    return Matrix([row + [sum(a * v for a, v in zip(row, x))] for row in A])
+
+
+def erro(x, referencia):
+    return max(abs(float(a) - float(b)) for a, b in zip(x, referencia))
+
+
+def test_determinante_com_troca_de_linhas():
+    pivotada = Matrix([[0, 2, 1], [1, 1, 0], [3, 0, 4]])
+    assert pivotada.determinant() == pytest.approx(float(pivotada.determinant_exact()))
+    assert Matrix([[0, 1], [1, 0]]).determinant() == -1
+
+
+def test_refinado_converge_em_matriz_bem_condicionada():
+    M = hilbert_aumentada(8)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        x = M.solve_refined()
+    assert erro(x, M.solve_exact()) < 1e-14
+
+
+def test_refinado_nunca_pior_que_sem_refino():
+    # Hilbert(40) tem número de condição ~1e60: o refinamento diverge e deve parar
+    M = hilbert_aumentada(40)
+    n = M.rows
+    LU, perm = _lu_decompose([row[:n] for row in M.data])
+    sem_refino = _lu_solve(LU, perm, [row[n] for row in M.data])
+    with pytest.warns(RuntimeWarning):
+        x = M.solve_refined()
+    exata = M.solve_exact()
+    assert erro(x, exata) <= erro(sem_refino, exata)
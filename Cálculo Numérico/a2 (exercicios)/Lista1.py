@@ -1,33 +1,23 @@
 def CalcA(a, b, c):
     return a + b * c
 
-print(CalcA(10, 20, 30))
-
 def CalcB(a,b):
     return a**2 / b
 
-print(CalcB(4, 30))
-
 def CalcC(a, b, c, d):
     return (a**4 + b) * c - d
 
-print(CalcC(9, 2, 6, 1))
-
 def Calc2(a, b, c, d, e, f, g):
     return a % b * c**2 + d - e * (f / g)
-print(Calc2(10, 3, 10, 1, 10, 4, 2))
 
 def Calc3(a, b, c):
     return a + b + c
-print(Calc3(1, 2, 3))
 
 def Calc4(a, b):
     return a + (a * b)
-print(Calc4(750, 0.15))
 
 def Calc5(d, h, m, s):
     return  (s + (m * 60) + (h * 3600) + (d * 86400))
-print(Calc5(10, 10, 10, 10))
 
 def Calc6():
     a = input('Insira um numero')
@@ -52,6 +42,12 @@ def Calc7(x):
             return False
     return x
 
-print(Calc7(13))
-
-
+if __name__ == "__main__":
+    print(CalcA(10, 20, 30))
+    print(CalcB(4, 30))
+    print(CalcC(9, 2, 6, 1))
+    print(Calc2(10, 3, 10, 1, 10, 4, 2))
+    print(Calc3(1, 2, 3))
+    print(Calc4(750, 0.15))
+    print(Calc5(10, 10, 10, 10))
+    print(Calc7(13))
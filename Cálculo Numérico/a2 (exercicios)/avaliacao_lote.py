@@ -0,0 +1,222 @@
+# Avaliação em lote das fórmulas de python_intro.py (as mesmas de a1/Aula1.py) e
+# de Lista1.py (CalcA a Calc5). Cada parâmetro vira uma coluna (lista, array.array,
+# ndarray do NumPy ou qualquer iterável) e a fórmula é aplicada à coluna inteira de
+# uma vez: como as fórmulas são só aritmética, a própria definição escalar, chamada
+# com ndarrays, já é a versão vetorizada. Sem NumPy, cai no laço escalar.
+# Os dois caminhos não retornam os mesmos tipos: o vetorizado converte tudo para
+# float64 (int64 estouraria em silêncio onde o int do Python não estoura), enquanto
+# o escalar mantém os tipos do Python (int com int continua int).
+
+import inspect
+import math
+import random
+import time
+from itertools import islice
+from numbers import Number
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from python_intro import soma, operacoes, vol, polinomio
+from Lista1 import CalcA, CalcB, CalcC, Calc2, Calc3, Calc4, Calc5
+
+FORMULAS = {f.__name__: f for f in (soma, operacoes, vol, polinomio,
+                                    CalcA, CalcB, CalcC, Calc2, Calc3, Calc4, Calc5)}
+
+# Fórmulas que retornam tupla: quantidade de colunas de saída (as demais retornam um valor).
+# Só é consultado quando a entrada é vazia e não há resultado de onde tirar o formato.
+SAIDAS = {operacoes: 2}
+
+# Linhas por bloco em avaliar_em_blocos
+TAMANHO_BLOCO = 1 << 16
+
+
+def _formula(formula):
+    """Aceita o nome de uma fórmula de FORMULAS ou a própria função."""
+    if callable(formula):
+        return formula
+    try:
+        return FORMULAS[formula]
+    except KeyError:
+        raise ValueError(f"Fórmula desconhecida: {formula!r}.") from None
+
+
+def _usar_numpy(usar_numpy):
+    if usar_numpy and np is None:
+        raise ImportError("NumPy não está instalado.")
+    return np is not None if usar_numpy is None else usar_numpy
+
+
+def _saidas(f, resultados, aridade):
+    """
+    Quantidade de colunas de saída de f (None se f retorna um único valor), tirada
+    do primeiro resultado. Com entrada vazia usa SAIDAS; fórmulas fora da tabela são
+    chamadas uma vez com 1.0 em cada parâmetro e, se não estiverem definidas nesse
+    ponto, são tratadas como de um único valor.
+    """
+    if resultados:
+        return len(resultados[0]) if isinstance(resultados[0], tuple) else None
+    if f in SAIDAS:
+        return SAIDAS[f]
+    try:
+        exemplo = f(*[1.0] * aridade)
+    except (ArithmeticError, ValueError):
+        return None
+    return len(exemplo) if isinstance(exemplo, tuple) else None
+
+
+def _escalar(f, colunas):
+    """
+    Avalia f linha a linha com a definição escalar. Números soltos valem para todas as linhas.
+    :return: Lista de resultados, ou tupla de listas se f retorna tupla (como operacoes),
+             com o mesmo formato também para entradas vazias.
+    """
+    tamanhos = [len(c) for c in colunas if not isinstance(c, Number)]
+    n = min(tamanhos) if tamanhos else 1
+    linhas = zip(*[[c] * n if isinstance(c, Number) else c for c in colunas])
+    resultados = [f(*linha) for linha in linhas]
+    saidas = _saidas(f, resultados, len(colunas))
+    if saidas is not None:
+        return tuple([r[i] for r in resultados] for i in range(saidas))
+    return resultados
+
+
+def _vetorial(f, colunas):
+    """
+    Avalia f sobre as colunas inteiras convertidas para ndarray float64.
+    :return: ndarray, ou tupla de ndarrays se f retorna tupla.
+    """
+    convertidas = [c if isinstance(c, Number) else np.asarray(c, dtype=np.float64) for c in colunas]
+    tamanhos = [len(c) for c in convertidas if not isinstance(c, Number)]
+    if tamanhos and min(tamanhos) != max(tamanhos):
+        # mesmo comportamento do zip no modo escalar: corta na coluna mais curta
+        convertidas = [c if isinstance(c, Number) else c[:min(tamanhos)] for c in convertidas]
+    return f(*convertidas)
+
+
+def avaliar(formula, *colunas, usar_numpy=None):
+    """
+    Avalia uma fórmula sobre colunas de parâmetros que cabem na memória.
+    Com NumPy os valores são convertidos para float64 (colunas de int também) e a
+    divisão por zero resulta em inf/nan (com aviso) em vez de ZeroDivisionError; sem
+    NumPy os resultados mantêm os tipos do Python (ex.: soma de ints retorna ints).
+    :param formula: Nome em FORMULAS (ex.: 'polinomio') ou uma função aritmética.
+    :param colunas: Uma coluna por parâmetro; um número sozinho vale para todas as linhas.
+    :param usar_numpy: None usa NumPy se estiver instalado; False força o laço escalar.
+    :return: Coluna de resultados (ndarray com NumPy, lista sem), ou tupla de colunas.
+    """
+    f = _formula(formula)
+    if _usar_numpy(usar_numpy):
+        return _vetorial(f, colunas)
+    return _escalar(f, [c if isinstance(c, Number) else list(c) for c in colunas])
+
+
+def _blocos(coluna, tamanho):
+    """Divide uma coluna em blocos: fatias se ela permite, senão lendo do iterador."""
+    if hasattr(coluna, '__len__') and hasattr(coluna, '__getitem__'):
+        for i in range(0, len(coluna), tamanho):
+            yield coluna[i:i + tamanho]
+        return
+    iterador = iter(coluna)
+    while True:
+        bloco = list(islice(iterador, tamanho))
+        if not bloco:
+            return
+        yield bloco
+
+
+def avaliar_em_blocos(formula, *colunas, tamanho_bloco=TAMANHO_BLOCO, usar_numpy=None):
+    """
+    Gerador que avalia a fórmula bloco a bloco, para entradas maiores que a memória
+    (as colunas podem ser geradores, ex.: lendo de um arquivo). Só um bloco de cada
+    coluna fica na memória por vez.
+    :return: Um resultado de avaliar(...) por bloco, na ordem das linhas.
+    """
+    f = _formula(formula)
+    numpy = _usar_numpy(usar_numpy)
+    if all(isinstance(c, Number) for c in colunas):
+        yield avaliar(f, *colunas, usar_numpy=numpy)
+        return
+    geradores = [None if isinstance(c, Number) else _blocos(c, tamanho_bloco) for c in colunas]
+    while True:
+        bloco = []
+        for coluna, gerador in zip(colunas, geradores):
+            if gerador is None:
+                bloco.append(coluna)
+                continue
+            parte = next(gerador, None)
+            if parte is None:
+                return
+            bloco.append(parte)
+        yield avaliar(f, *bloco, usar_numpy=numpy)
+
+
+def verificar_paridade(n=10_000, tamanho_bloco=1000, semente=0):
+    """
+    Compara, para cada fórmula e sobre valores aleatórios, as chamadas diretas da
+    definição escalar com avaliar e avaliar_em_blocos (colunas passadas como
+    geradores) no laço escalar e, se o NumPy estiver instalado, também nos modos
+    vetorizados.
+    :return: Dicionário {fórmula: maior erro relativo}.
+    """
+    rng = random.Random(semente)
+    modos = [False] + ([True] if np is not None else [])
+    erros = {}
+    for nome, f in FORMULAS.items():
+        aridade = len(inspect.signature(f).parameters)
+        # valores longe de zero para não dividir por zero em CalcB, Calc2...
+        colunas = [[rng.uniform(0.5, 50) for _ in range(n)] for _ in range(aridade)]
+        direto = [f(*linha) for linha in zip(*colunas)]
+        saidas = SAIDAS.get(f)
+        if saidas is not None:
+            direto = [[r[i] for r in direto] for i in range(saidas)]
+        else:
+            direto = [direto]
+
+        obtidos = []
+        for numpy in modos:
+            obtidos.append(avaliar(f, *colunas, usar_numpy=numpy))
+            blocos = list(avaliar_em_blocos(f, *[(x for x in c) for c in colunas],
+                                            tamanho_bloco=tamanho_bloco, usar_numpy=numpy))
+            if saidas is not None:
+                obtidos.append(tuple([x for b in blocos for x in b[i]] for i in range(saidas)))
+            else:
+                obtidos.append([x for b in blocos for x in b])
+
+        pior = 0.0
+        for obtido in obtidos:
+            colunas_obtidas = obtido if saidas is not None else [obtido]
+            for esperado_coluna, obtido_coluna in zip(direto, colunas_obtidas):
+                if len(obtido_coluna) != n:
+                    raise AssertionError(f"{nome}: {len(obtido_coluna)} resultados para {n} linhas")
+                for e, o in zip(esperado_coluna, obtido_coluna):
+                    if not math.isclose(e, o, rel_tol=1e-12, abs_tol=1e-12):
+                        raise AssertionError(f"{nome}: escalar {e!r} != lote {o!r}")
+                    pior = max(pior, abs(e - o) / max(abs(e), 1e-300))
+        erros[nome] = pior
+
+    # Formato da saída para entrada vazia
+    assert avaliar('operacoes', [], [], usar_numpy=False) == ([], [])
+    assert avaliar('vol', [], usar_numpy=False) == []
+    # Fórmula indefinida em 1.0: o formato vem do resultado, sem sondar f
+    assert avaliar(lambda a: 1 / (a - 1), [2.0, 3.0], usar_numpy=False) == [1.0, 0.5]
+    return erros
+
+
+if __name__ == "__main__":
+    modo = "laço escalar e NumPy" if np is not None else "laço escalar (NumPy não instalado)"
+    for nome, erro in verificar_paridade().items():
+        print(f"{nome:<10} paridade ok em {modo} (erro relativo máximo {erro:.1e})")
+    if np is not None:
+        n = 1_000_000
+        r = [random.uniform(0, 10) for _ in range(n)]
+        inicio = time.perf_counter()
+        [vol(x) for x in r]
+        escalar = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        for _ in avaliar_em_blocos('vol', r):
+            pass
+        vetorial = time.perf_counter() - inicio
+        print(f"\nvol em {n} linhas: laço {escalar:.3f}s, em blocos {vetorial:.3f}s")
@@ -0,0 +1,148 @@
+from math import isqrt
+
+# Tamanho do segmento do crivo, em números ímpares (~256 KiB, cabe no cache L2)
+SEGMENTO = 1 << 18
+
+# Bases de Miller-Rabin determinísticas para n < 3.3 * 10**24 (cobre 64 bits)
+BASES_MR = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def primos_ate(n):
+    """
+    Crivo de Eratóstenes simples, guardando apenas os ímpares.
+    :param n: Limite superior (inclusivo).
+    :return: Lista com os primos <= n.
+    """
+    if n < 2:
+        return []
+    # crivo[i] representa o número 2*i + 1
+    crivo = bytearray([1]) * ((n + 1) // 2)
+    crivo[0] = 0
+    for i in range(1, (isqrt(n) + 1) // 2):
+        if crivo[i]:
+            p = 2 * i + 1
+            inicio = p * p // 2
+            crivo[inicio::p] = bytes(len(range(inicio, len(crivo), p)))
+    return [2] + [2 * i + 1 for i, v in enumerate(crivo) if v]
+
+
+def _segmentos(inicio, fim, segmento):
+    """
+    Gera (base, crivo) para cada segmento ímpar de [inicio, fim), onde
+    crivo[i] indica se base + 2*i é primo.
+    """
+    base_primos = primos_ate(isqrt(fim - 1) + 1)[1:]  # sem o 2
+    base = inicio | 1  # primeiro ímpar >= inicio
+    while base < fim:
+        tamanho = min(segmento, (fim - base + 1) // 2)
+        crivo = bytearray([1]) * tamanho
+        topo = base + 2 * tamanho
+        for p in base_primos:
+            if p * p >= topo:
+                break
+            # primeiro múltiplo ímpar de p que seja >= max(p*p, base)
+            m = max(p * p, (base + p - 1) // p * p)
+            if m % 2 == 0:
+                m += p
+            j = (m - base) // 2
+            if j < tamanho:
+                crivo[j::p] = bytes(len(range(j, tamanho, p)))
+        if base == 1:
+            crivo[0] = 0
+        yield base, crivo
+        base = topo
+
+
+def crivo_segmentado(inicio, fim, segmento=SEGMENTO):
+    """
+    Crivo de Eratóstenes segmentado sobre o intervalo [inicio, fim).
+    Guarda apenas os ímpares, um byte por número, em segmentos do tamanho do cache.
+    :param inicio: Início do intervalo (inclusivo).
+    :param fim: Fim do intervalo (exclusivo).
+    :param segmento: Quantidade de ímpares por segmento.
+    :return: Gerador com os primos do intervalo, em ordem.
+    """
+    if inicio <= 2 < fim:
+        yield 2
+    for base, crivo in _segmentos(max(inicio, 3), fim, segmento):
+        for i in range(len(crivo)):
+            if crivo[i]:
+                yield base + 2 * i
+
+
+def miller_rabin(n):
+    """
+    Teste de primalidade de Miller-Rabin determinístico para n < 3.3 * 10**24.
+    :param n: Inteiro a ser testado.
+    :return: True se n for primo.
+    """
+    if n < 2:
+        return False
+    for p in BASES_MR:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in BASES_MR:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n):
+    """
+    Verifica se n é primo (versão corrigida do Calc7: 2 é primo e o retorno é booleano).
+    :param n: Inteiro a ser testado.
+    :return: True se n for primo.
+    """
+    return miller_rabin(n)
+
+
+def is_prime_many(numeros, densidade=8):
+    """
+    Classifica muitos números de uma vez. Se os números forem densos no
+    intervalo [menor, maior] e o crivo dos primos-base até √maior também for
+    pequeno perto da quantidade de números, usa o crivo segmentado; senão
+    (números esparsos ou muito grandes) usa Miller-Rabin para cada um.
+    :param numeros: Iterável de inteiros.
+    :param densidade: Razão máxima (tamanho do intervalo / quantidade de números,
+                      e também √maior / quantidade) para a qual o crivo compensa.
+    :return: Lista de booleanos na mesma ordem da entrada.
+    """
+    numeros = list(numeros)
+    if not numeros:
+        return []
+    # Números menores que 2 nunca são primos; o crivo só cobre [max(menor, 0), maior]
+    maior = max(numeros)
+    if maior < 2:
+        return [False] * len(numeros)
+    menor = max(min(numeros), 0)
+    limite = densidade * len(numeros)
+    if maior - menor > limite or isqrt(maior) > limite:
+        return [miller_rabin(n) for n in numeros]
+
+    # Marca os primos do intervalo em um único bytearray indexado por n - menor
+    marcado = bytearray(maior - menor + 1)
+    if menor <= 2 <= maior:
+        marcado[2 - menor] = 1
+    for base, crivo in _segmentos(max(menor, 3), maior + 1, SEGMENTO):
+        marcado[base - menor:base - menor + 2 * len(crivo):2] = crivo
+    return [n >= menor and marcado[n - menor] == 1 for n in numeros]
+
+
+# Exemplo de uso:
+if __name__ == "__main__":
+    print(is_prime(2), is_prime(13), is_prime(15))
+    print(list(crivo_segmentado(90, 130)))
+    print(miller_rabin(18446744073709551557))  # maior primo de 64 bits
+    print(sum(is_prime_many(range(1, 1000001))))  # 78498 primos até 10**6
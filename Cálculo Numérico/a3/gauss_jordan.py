@@ -52,7 +52,7 @@ def GaussJordanMethod(augMat):
          else:
             pass
    
-   print_matrix(augMat)
+   return augMat
 
 matrix = [[0, 2, 0, 1, 0],
           [2, 2, 3, 2, -2],
@@ -65,4 +65,4 @@ matrix = [[0, 2, 0, 1, 0],
 #           [5.0, -3.0, 1.0, 14.0],
 #         ]
 
-GaussJordanMethod(matrix)
\ No newline at end of file
+print_matrix(GaussJordanMethod(matrix))
\ No newline at end of file
@@ -88,7 +88,7 @@ def GaussJordanMethod(augMat):
                 for k in range(m):
                     augMat[j][k] -= coef * augMat[i][k]
     
-    print_matrix(augMat)
+    return augMat
 
 matrix = [[3.0, 2.0, -4.0, 3.0], [2.0, 3.0, 3.0, 15.0], [5.0, -3.0, 1.0, 14.0]]
 mc = coef_matrix(matrix)
@@ -97,4 +97,4 @@ det = determinant(mc)
 print(det)
 result = verifica_non_singularidade(mc)
 print(result)
-GaussJordanMethod(matrix)
+print_matrix(GaussJordanMethod(matrix))
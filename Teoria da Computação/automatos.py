@@ -0,0 +1,227 @@
+# Compilação dos autômatos finitos (.jflap do tipo 'fsa') para uma tabela de
+# transições densa, com determinização do AFN pela construção de subconjuntos.
+
+import sys
+
+from jflap import ler_jflap
+
+
+class AFD:
+    """
+    Autômato finito determinístico compilado.
+    - alfabeto: lista de símbolos (caracteres); o símbolo de índice len(alfabeto)
+      representa "qualquer outro caractere" e leva sempre ao estado morto
+    - delta: lista de linhas, delta[q][s] = próximo estado (inteiros)
+    - inicial: estado inicial
+    - finais: bytes, finais[q] == 1 se q é de aceitação
+    - subconjuntos: para cada estado, o conjunto de estados do AFN de origem
+    - nomes: rótulo de cada estado, usado nos perfis de execução
+    """
+    def __init__(self, alfabeto, delta, inicial, finais, subconjuntos=None, nomes=None):
+        self.alfabeto = alfabeto
+        self.delta = delta
+        self.inicial = inicial
+        self.finais = finais
+        self.subconjuntos = subconjuntos
+        self.nomes = nomes or [f"d{q}" for q in range(len(delta))]
+        self.indice = {c: i for i, c in enumerate(alfabeto)}
+        # Tabela para bytes.translate: código latin-1 -> índice do símbolo
+        outro = len(alfabeto)
+        if outro < 256 and all(len(c) == 1 and ord(c) < 256 for c in alfabeto):
+            tabela = bytearray([outro]) * 256
+            for c, i in self.indice.items():
+                tabela[ord(c)] = i
+            self._tradutor = bytes(tabela)
+        else:
+            self._tradutor = None
+
+    def __len__(self):
+        return len(self.delta)
+
+    def codificar(self, palavra):
+        """
+        Converte a palavra na sequência de índices de símbolos.
+        :param palavra: String de entrada.
+        :return: bytes (caminho rápido) ou lista de índices.
+        """
+        if self._tradutor is not None:
+            try:
+                return palavra.encode('latin-1').translate(self._tradutor)
+            except UnicodeEncodeError:
+                pass
+        outro = len(self.alfabeto)
+        return [self.indice.get(c, outro) for c in palavra]
+
+    def aceita(self, palavra):
+        """
+        Verifica se a palavra pertence à linguagem do autômato.
+        :param palavra: String de entrada.
+        :return: True se aceita.
+        """
+        delta = self.delta
+        q = self.inicial
+        for s in self.codificar(palavra):
+            q = delta[q][s]
+        return self.finais[q] == 1
+
+    def aceita_perfilado(self, palavra, perfil):
+        """
+        Como aceita, mas contando estados e transições usados.
+        :param palavra: String de entrada.
+        :param perfil: Objeto com contadores estados/transicoes e totais
+                       execucoes/passos/celulas (ex.: turing.PerfilExecucao).
+        :return: True se aceita.
+        """
+        delta = self.delta
+        nomes = self.nomes
+        q = self.inicial
+        simbolos = self.alfabeto + ['?']
+        for s in self.codificar(palavra):
+            r = delta[q][s]
+            perfil.estados[nomes[q]] += 1
+            perfil.transicoes[f"{nomes[q]} --{simbolos[s]}--> {nomes[r]}"] += 1
+            q = r
+        perfil.execucoes += 1
+        perfil.passos += len(palavra)
+        perfil.celulas += len(palavra)
+        return self.finais[q] == 1
+
+    def aceita_muitos(self, palavras):
+        """
+        Verifica a pertinência de muitas palavras de uma vez.
+        :param palavras: Iterável de strings.
+        :return: Lista de booleanos na mesma ordem.
+        """
+        delta = self.delta
+        inicial = self.inicial
+        finais = self.finais
+        codificar = self.codificar
+        resultado = []
+        append = resultado.append
+        for palavra in palavras:
+            q = inicial
+            for s in codificar(palavra):
+                q = delta[q][s]
+            append(finais[q] == 1)
+        return resultado
+
+    def conta_aceitas(self, palavras):
+        """
+        Conta quantas palavras são aceitas.
+        :param palavras: Iterável de strings.
+        :return: Número de palavras aceitas.
+        """
+        return sum(self.aceita_muitos(palavras))
+
+
+def _separar_simbolos(maquina):
+    """
+    Normaliza as transições do AFN para símbolos de um caractere: uma transição
+    com rótulo 'ab' vira uma cadeia de estados intermediários.
+    :return: (lista de estados, lista de transições (origem, símbolo, destino)), onde
+             símbolo '' representa a transição vazia (lambda).
+    """
+    estados = list(maquina.estados)
+    transicoes = []
+    extra = 0
+    for t in maquina.transicoes:
+        rotulo = t.get('input', '')
+        origem = t['from']
+        if len(rotulo) <= 1:
+            transicoes.append((origem, rotulo, t['to']))
+            continue
+        for k, c in enumerate(rotulo):
+            if k == len(rotulo) - 1:
+                destino = t['to']
+            else:
+                destino = f"_intermediario{extra}"
+                extra += 1
+                estados.append(destino)
+            transicoes.append((origem, c, destino))
+            origem = destino
+    return estados, transicoes
+
+
+def determinizar(maquina):
+    """
+    Compila um autômato finito (determinístico ou não) para um AFD denso
+    pela construção de subconjuntos, com fecho-lambda.
+    :param maquina: MaquinaJflap do tipo 'fsa'.
+    :return: Instância de AFD. O estado 0 é sempre o estado morto (conjunto vazio).
+    """
+    if maquina.tipo != 'fsa':
+        raise ValueError(f"Esperado autômato finito ('fsa'), recebido '{maquina.tipo}'.")
+    estados, transicoes = _separar_simbolos(maquina)
+    alfabeto = sorted({c for _, c, _ in transicoes if c})
+    indice = {c: i for i, c in enumerate(alfabeto)}
+
+    vazias = {q: set() for q in estados}
+    por_simbolo = {q: [set() for _ in alfabeto] for q in estados}
+    for origem, c, destino in transicoes:
+        if c:
+            por_simbolo[origem][indice[c]].add(destino)
+        else:
+            vazias[origem].add(destino)
+
+    def fecho(conjunto):
+        pilha = list(conjunto)
+        fechado = set(conjunto)
+        while pilha:
+            q = pilha.pop()
+            for r in vazias[q]:
+                if r not in fechado:
+                    fechado.add(r)
+                    pilha.append(r)
+        return frozenset(fechado)
+
+    morto = frozenset()
+    inicio = fecho({maquina.inicial}) if maquina.inicial is not None else morto
+    numero = {morto: 0}
+    subconjuntos = [morto]
+    if inicio not in numero:
+        numero[inicio] = 1
+        subconjuntos.append(inicio)
+    delta = []
+    i = 0
+    while i < len(subconjuntos):
+        atual = subconjuntos[i]
+        linha = []
+        for s in range(len(alfabeto)):
+            proximo = set()
+            for q in atual:
+                proximo |= por_simbolo[q][s]
+            proximo = fecho(proximo) if proximo else morto
+            if proximo not in numero:
+                numero[proximo] = len(subconjuntos)
+                subconjuntos.append(proximo)
+            linha.append(numero[proximo])
+        linha.append(0)  # qualquer outro caractere -> estado morto
+        delta.append(linha)
+        i += 1
+
+    finais = bytes(1 if atual & maquina.finais else 0 for atual in subconjuntos)
+    nomes = ['{' + ','.join(sorted(maquina.estados.get(q, q) for q in atual)) + '}'
+             for atual in subconjuntos]
+    return AFD(alfabeto, delta, numero[inicio], finais, subconjuntos, nomes)
+
+
+def carregar(caminho):
+    """
+    Lê um arquivo .jflap e compila o autômato para um AFD.
+    :param caminho: Caminho do arquivo .jflap.
+    :return: Instância de AFD.
+    """
+    return determinizar(ler_jflap(caminho))
+
+
+if __name__ == '__main__':
+    # Uso: python automatos.py arquivo.jflap [palavras...]
+    # Sem palavras na linha de comando, lê uma palavra por linha da entrada padrão.
+    if len(sys.argv) < 2:
+        print("Uso: python automatos.py arquivo.jflap [palavras...]")
+        raise SystemExit(1)
+    afd = carregar(sys.argv[1])
+    print(f"AFD com {len(afd)} estados, alfabeto {afd.alfabeto}")
+    palavras = sys.argv[2:] or (linha.rstrip('\r\n') for linha in sys.stdin)
+    for palavra in palavras:
+        print(f"{palavra!r}: {'aceita' if afd.aceita(palavra) else 'rejeita'}")
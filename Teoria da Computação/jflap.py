@@ -0,0 +1,101 @@
+# Leitura dos arquivos .jflap (XML do JFLAP) usados nas listas de ADF e MDT.
+# O arquivo é lido em fluxo (iterparse) e cada bloco <structure> é liberado
+# da memória assim que é processado.
+
+import xml.etree.ElementTree as ET
+
+
+class MaquinaJflap:
+    """
+    Conteúdo bruto de um arquivo .jflap, antes de qualquer compilação.
+    - tipo: 'fsa', 'turing', ...
+    - estados: dicionário {id: nome}
+    - inicial: id do estado inicial (None se o arquivo não definir um)
+    - finais: conjunto de ids dos estados finais
+    - transicoes: lista de dicionários com os campos da transição
+      (ex.: {'from': '0', 'to': '1', 'input': 'a'} para autômatos finitos,
+       {'from': ..., 'to': ..., 'read0': ..., 'write0': ..., 'move0': ...} para MT)
+    - fitas: número de fitas (apenas MT)
+    - branco: símbolo branco (apenas MT)
+    """
+    def __init__(self, tipo):
+        self.tipo = tipo
+        self.estados = {}
+        self.inicial = None
+        self.finais = set()
+        self.transicoes = []
+        self.fitas = 1
+        self.branco = '□'
+
+
+def _id_estado(elem):
+    """Extrai o id de <from>/<to>/<state>, aceitando <id> filho ou texto direto."""
+    filho = elem.find('id')
+    if filho is not None:
+        return filho.text.strip()
+    if elem.get('id') is not None:
+        return elem.get('id')
+    return (elem.text or '').strip()
+
+
+def _texto(elem):
+    """Texto de um elemento; tags vazias (<input/>) representam a palavra vazia."""
+    return elem.text or ''
+
+
+def ler_jflap(caminho):
+    """
+    Lê um arquivo .jflap em fluxo.
+    :param caminho: Caminho do arquivo.
+    :return: Instância de MaquinaJflap.
+    """
+    maquina = None
+    for evento, elem in ET.iterparse(caminho, events=('start', 'end')):
+        tag = elem.tag
+        if evento == 'start':
+            if tag == 'structure' and elem.get('type') in ('fsa', 'turing', 'pda', 'mealy', 'moore'):
+                maquina = MaquinaJflap(elem.get('type'))
+            continue
+        if maquina is None:
+            continue
+
+        if tag == 'tapes' and len(elem) == 0 and maquina.tipo == 'turing':
+            maquina.fitas = max(maquina.fitas, int(elem.text))
+        elif tag == 'structure':
+            tipo = elem.get('type')
+            if tipo == 'state_set':
+                for estado in elem.iter('state'):
+                    maquina.estados[_id_estado(estado)] = estado.findtext('name', '').strip()
+                    # Formato alternativo: marcadores <initial/> e <final/> no próprio estado
+                    if estado.find('initial') is not None:
+                        maquina.inicial = _id_estado(estado)
+                    if estado.find('final') is not None:
+                        maquina.finais.add(_id_estado(estado))
+                elem.clear()
+            elif tipo == 'start_state':
+                estado = elem.find('state')
+                if estado is not None:
+                    maquina.inicial = _id_estado(estado)
+                elem.clear()
+            elif tipo == 'final_states':
+                for estado in elem.iter('state'):
+                    maquina.finais.add(_id_estado(estado))
+                elem.clear()
+            elif tipo == 'blank_symbol':
+                maquina.branco = elem.findtext('value', maquina.branco)
+                elem.clear()
+            elif tipo == 'transition_set':
+                elem.clear()
+        elif tag in ('fsa_trans', 'transition'):
+            transicao = {}
+            for campo in elem:
+                if campo.tag in ('from', 'to'):
+                    transicao[campo.tag] = _id_estado(campo)
+                elif campo.tag != 'tapes':
+                    transicao[campo.tag] = _texto(campo)
+            maquina.transicoes.append(transicao)
+            elem.clear()
+
+    if maquina is None:
+        raise ValueError(f"Arquivo sem máquina reconhecida: {caminho}")
+    return maquina
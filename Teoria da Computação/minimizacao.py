@@ -0,0 +1,240 @@
+# Minimização de AFDs (Hopcroft), verificação de equivalência (Hopcroft-Karp)
+# e de inclusão de linguagens, e cache em disco dos autômatos compilados.
+
+import glob
+import hashlib
+import json
+import os
+import sys
+from collections import deque
+
+from automatos import AFD, carregar
+
+PASTA_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_jflap')
+
+# Versão do compilador e do formato do cache: incremente ao mudar carregar, minimizar
+# ou o JSON gravado, para que entradas antigas deixem de ser usadas
+VERSAO_CACHE = 2
+
+
+def _alcancaveis(afd):
+    """Estados alcançáveis a partir do inicial (o estado morto 0 sempre incluído)."""
+    vistos = {0, afd.inicial}
+    pilha = [afd.inicial]
+    while pilha:
+        q = pilha.pop()
+        for r in afd.delta[q]:
+            if r not in vistos:
+                vistos.add(r)
+                pilha.append(r)
+    return sorted(vistos)
+
+
+def minimizar(afd):
+    """
+    Minimiza um AFD pelo algoritmo de Hopcroft, O(n k log n).
+    :param afd: Instância de AFD.
+    :return: Novo AFD mínimo, mantendo o estado morto como estado 0.
+    """
+    estados = _alcancaveis(afd)
+    novo_id = {q: i for i, q in enumerate(estados)}
+    delta = [[novo_id[r] for r in afd.delta[q]] for q in estados]
+    finais = [afd.finais[q] for q in estados]
+    n = len(estados)
+    k = len(delta[0])
+
+    # inverso[s][q] = estados p com delta[p][s] == q
+    inverso = [[[] for _ in range(n)] for _ in range(k)]
+    for p in range(n):
+        for s, q in enumerate(delta[p]):
+            inverso[s][q].append(p)
+
+    aceitacao = {q for q in range(n) if finais[q]}
+    rejeicao = set(range(n)) - aceitacao
+    blocos = [b for b in (aceitacao, rejeicao) if b]
+    bloco = [0] * n
+    for b, conjunto in enumerate(blocos):
+        for q in conjunto:
+            bloco[q] = b
+    pendentes = deque([min(range(len(blocos)), key=lambda b: len(blocos[b]))])
+
+    while pendentes:
+        a = pendentes.popleft()
+        divisor = list(blocos[a])
+        for s in range(k):
+            # Agrupa por bloco os predecessores pelo símbolo s
+            tocados = {}
+            for q in divisor:
+                for p in inverso[s][q]:
+                    tocados.setdefault(bloco[p], set()).add(p)
+            for b, parte in tocados.items():
+                if len(parte) == len(blocos[b]):
+                    continue
+                resto = blocos[b] - parte
+                # O bloco original fica com a parte maior; a menor vira bloco novo
+                menor, maior = (parte, resto) if len(parte) <= len(resto) else (resto, parte)
+                blocos[b] = maior
+                novo = len(blocos)
+                blocos.append(menor)
+                for q in menor:
+                    bloco[q] = novo
+                # Se b já está pendente, as duas partes ficam pendentes; senão basta
+                # a menor. Em ambos os casos a parte nova (menor) entra na fila.
+                pendentes.append(novo)
+
+    # Renumera os blocos com o bloco do estado morto como 0
+    ordem = {bloco[0]: 0}
+    for q in range(n):
+        ordem.setdefault(bloco[q], len(ordem))
+    representante = {}
+    for q in range(n):
+        representante.setdefault(ordem[bloco[q]], q)
+    novo_delta = [[ordem[bloco[r]] for r in delta[representante[b]]] for b in range(len(ordem))]
+    novo_finais = bytes(finais[representante[b]] for b in range(len(ordem)))
+    return AFD(afd.alfabeto, novo_delta, ordem[bloco[novo_id[afd.inicial]]], novo_finais)
+
+
+def _unificar(a, b):
+    """
+    Reescreve as tabelas de dois AFDs sobre a união dos alfabetos.
+    Símbolos ausentes em um autômato levam ao seu estado morto.
+    :return: (alfabeto, delta_a, delta_b), com a coluna final para "outros".
+    """
+    alfabeto = sorted(set(a.alfabeto) | set(b.alfabeto))
+
+    def reescrever(afd):
+        colunas = [afd.indice.get(c, len(afd.alfabeto)) for c in alfabeto] + [len(afd.alfabeto)]
+        return [[linha[s] for s in colunas] for linha in afd.delta]
+
+    return alfabeto, reescrever(a), reescrever(b)
+
+
+def equivalentes(a, b):
+    """
+    Verifica se dois AFDs reconhecem a mesma linguagem (Hopcroft-Karp,
+    union-find sobre a união disjunta dos estados).
+    :param a: Instância de AFD.
+    :param b: Instância de AFD.
+    :return: (True, None) ou (False, palavra que distingue os autômatos).
+    """
+    alfabeto, delta_a, delta_b = _unificar(a, b)
+    deslocamento = len(delta_a)
+    delta = delta_a + [[r + deslocamento for r in linha] for linha in delta_b]
+    finais = bytes(a.finais) + bytes(b.finais)
+    pai = list(range(len(delta)))
+
+    def raiz(x):
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]
+            x = pai[x]
+        return x
+
+    inicio = (a.inicial, b.inicial + deslocamento)
+    if finais[inicio[0]] != finais[inicio[1]]:
+        return False, ''
+    pai[inicio[1]] = inicio[0]
+    fila = deque([(inicio, '')])
+    while fila:
+        (p, q), palavra = fila.popleft()
+        for s, c in enumerate(alfabeto):
+            r1, r2 = raiz(delta[p][s]), raiz(delta[q][s])
+            if r1 == r2:
+                continue
+            if finais[delta[p][s]] != finais[delta[q][s]]:
+                return False, palavra + c
+            pai[r2] = r1
+            fila.append(((delta[p][s], delta[q][s]), palavra + c))
+    return True, None
+
+
+def contido(a, b):
+    """
+    Verifica se L(a) está contida em L(b) pela construção do produto.
+    :param a: Instância de AFD.
+    :param b: Instância de AFD.
+    :return: (True, None) ou (False, palavra aceita por a e rejeitada por b).
+    """
+    alfabeto, delta_a, delta_b = _unificar(a, b)
+    inicio = (a.inicial, b.inicial)
+    vistos = {inicio}
+    fila = deque([(inicio, '')])
+    while fila:
+        (p, q), palavra = fila.popleft()
+        if a.finais[p] and not b.finais[q]:
+            return False, palavra
+        for s, c in enumerate(alfabeto):
+            par = (delta_a[p][s], delta_b[q][s])
+            if par not in vistos:
+                vistos.add(par)
+                fila.append((par, palavra + c))
+    return True, None
+
+
+def _hash_arquivo(caminho):
+    """SHA-256 do conteúdo do arquivo, prefixado pela versão do cache."""
+    h = hashlib.sha256(f'v{VERSAO_CACHE}\n'.encode())
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 16), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def carregar_minimo(caminho, pasta_cache=PASTA_CACHE):
+    """
+    Carrega um .jflap já determinizado e minimizado, usando o cache em disco.
+    A chave do cache é o hash do arquivo junto com VERSAO_CACHE, então só arquivos
+    alterados (ou todos, após uma mudança de versão) são recompilados.
+    :param caminho: Caminho do arquivo .jflap.
+    :param pasta_cache: Pasta do cache; None desativa o cache.
+    :return: (AFD mínimo, True se veio do cache).
+    """
+    if pasta_cache is None:
+        return minimizar(carregar(caminho)), False
+    arquivo_cache = os.path.join(pasta_cache, _hash_arquivo(caminho) + '.json')
+    if os.path.exists(arquivo_cache):
+        with open(arquivo_cache, encoding='utf-8') as f:
+            dados = json.load(f)
+        return AFD(dados['alfabeto'], dados['delta'], dados['inicial'], bytes(dados['finais'])), True
+    afd = minimizar(carregar(caminho))
+    os.makedirs(pasta_cache, exist_ok=True)
+    temporario = arquivo_cache + '.tmp'
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump({'alfabeto': afd.alfabeto, 'delta': afd.delta,
+                   'inicial': afd.inicial, 'finais': list(afd.finais)}, f)
+    os.replace(temporario, arquivo_cache)
+    return afd, False
+
+
+def compilar_pasta(pasta, pasta_cache=PASTA_CACHE):
+    """
+    Compila todos os .jflap do tipo 'fsa' de uma pasta, reaproveitando o cache.
+    :param pasta: Pasta com os arquivos .jflap.
+    :return: Dicionário {nome do arquivo: (AFD mínimo, veio_do_cache)}.
+    """
+    resultado = {}
+    for caminho in sorted(glob.glob(os.path.join(pasta, '*.jflap'))):
+        resultado[os.path.basename(caminho)] = carregar_minimo(caminho, pasta_cache)
+    return resultado
+
+
+if __name__ == '__main__':
+    # Uso: python minimizacao.py [pasta]   (padrão: "Lista sobre ADF")
+    pasta = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'Lista sobre ADF')
+    compilados = compilar_pasta(pasta)
+    for nome, (afd, do_cache) in compilados.items():
+        origem = 'cache' if do_cache else 'compilado'
+        print(f"{nome}: {len(afd)} estados (mínimo), alfabeto {afd.alfabeto} [{origem}]")
+
+    # Agrupa os autômatos que reconhecem a mesma linguagem
+    print("\nClasses de equivalência:")
+    grupos = []
+    for nome, (afd, _) in compilados.items():
+        for grupo in grupos:
+            if equivalentes(compilados[grupo[0]][0], afd)[0]:
+                grupo.append(nome)
+                break
+        else:
+            grupos.append([nome])
+    for grupo in grupos:
+        print("  " + ', '.join(grupo))
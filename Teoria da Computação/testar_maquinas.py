@@ -0,0 +1,232 @@
+# Executa vetores de teste contra os arquivos .jflap (autômatos finitos e
+# Máquinas de Turing) em um pool de processos e gera um perfil por máquina.
+#
+# Cada máquina "nome.jflap" pode ter um arquivo "nome.vetores" na mesma pasta,
+# com um caso por linha, campos separados por TAB:
+#
+#     entrada <TAB> aceita|rejeita [<TAB> conteúdo esperado da fita 0]
+#
+# - λ (ou campo vazio) representa a palavra vazia
+# - em máquinas multifita, as entradas de cada fita são separadas por '|'
+# - linhas vazias e iniciadas por '#' são ignoradas
+
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from jflap import ler_jflap
+from automatos import determinizar
+from turing import MaquinaTuring, PerfilExecucao
+
+EXTENSAO_VETORES = '.vetores'
+
+
+class CasoTeste:
+    """
+    Um vetor de teste.
+    - linha: número da linha no arquivo de vetores
+    - entrada: string (ou lista de strings, uma por fita)
+    - aceita: resultado esperado (True/False)
+    - saida: conteúdo esperado da fita 0, ou None para não verificar
+    """
+    def __init__(self, linha, entrada, aceita, saida=None):
+        self.linha = linha
+        self.entrada = entrada
+        self.aceita = aceita
+        self.saida = saida
+
+
+class ResultadoCaso:
+    """Resultado de um caso: passou, descrição do obtido e passos executados."""
+    def __init__(self, caso, passou, obtido, passos):
+        self.caso = caso
+        self.passou = passou
+        self.obtido = obtido
+        self.passos = passos
+
+
+def ler_vetores(caminho):
+    """
+    Lê um arquivo de vetores de teste.
+    :param caminho: Caminho do arquivo .vetores.
+    :return: Lista de CasoTeste.
+    """
+    casos = []
+    with open(caminho, encoding='utf-8') as f:
+        for numero, linha in enumerate(f, 1):
+            linha = linha.rstrip('\r\n')
+            if not linha.strip() or linha.lstrip().startswith('#'):
+                continue
+            campos = linha.split('\t')
+            if len(campos) < 2 or campos[1].strip() not in ('aceita', 'rejeita'):
+                raise ValueError(f"{caminho}:{numero}: esperado 'entrada<TAB>aceita|rejeita'.")
+            entrada = '' if campos[0] == 'λ' else campos[0]
+            if '|' in entrada:
+                entrada = ['' if t == 'λ' else t for t in entrada.split('|')]
+            saida = campos[2] if len(campos) > 2 else None
+            casos.append(CasoTeste(numero, entrada, campos[1].strip() == 'aceita', saida))
+    return casos
+
+
+def encontrar_maquinas(pasta):
+    """
+    Procura recursivamente os .jflap que possuem arquivo de vetores.
+    :param pasta: Pasta raiz.
+    :return: Lista de (caminho do .jflap, caminho dos vetores).
+    """
+    pares = []
+    for caminho in sorted(glob.glob(os.path.join(pasta, '**', '*.jflap'), recursive=True)):
+        vetores = os.path.splitext(caminho)[0] + EXTENSAO_VETORES
+        if os.path.exists(vetores):
+            pares.append((caminho, vetores))
+    return pares
+
+
+# Máquinas já compiladas neste processo (cada worker compila cada arquivo uma vez)
+_compiladas = {}
+
+
+def _compilar(caminho):
+    if caminho not in _compiladas:
+        maquina = ler_jflap(caminho)
+        _compiladas[caminho] = MaquinaTuring(maquina) if maquina.tipo == 'turing' else determinizar(maquina)
+    return _compiladas[caminho]
+
+
+def _executar_bloco(caminho, casos, max_passos, max_tempo, perfilar=False):
+    """
+    Executa um bloco de casos de uma máquina; é a unidade de trabalho do pool.
+    O tempo do perfil vem sempre da execução normal (com os macro-passos da MT);
+    com perfilar=True cada caso é executado de novo no modo instrumentado só
+    para contar estados, transições e células.
+    :return: (lista de ResultadoCaso, PerfilExecucao do bloco).
+    """
+    maquina = _compilar(caminho)
+    perfil = PerfilExecucao()
+    resultados = []
+    for caso in casos:
+        detalhe = PerfilExecucao() if perfilar else None
+        if isinstance(maquina, MaquinaTuring):
+            try:
+                inicio = time.perf_counter()
+                r = maquina.executar(caso.entrada, max_passos=max_passos, max_tempo=max_tempo)
+                perfil.tempo += time.perf_counter() - inicio
+                if perfilar:
+                    maquina.executar(caso.entrada, max_passos=max_passos, max_tempo=max_tempo, perfil=detalhe)
+            except ValueError as e:
+                resultados.append(ResultadoCaso(caso, False, f"erro: {e}", 0))
+                continue
+            passou = r.aceita == caso.aceita and (caso.saida is None or r.fitas[0] == caso.saida)
+            obtido = f"{'aceita' if r.aceita else 'rejeita'} ({r.motivo}), fita 0 = {r.fitas[0]!r}"
+            passos = r.passos
+        else:
+            if not isinstance(caso.entrada, str):
+                resultados.append(ResultadoCaso(
+                    caso, False, "erro: entrada com várias fitas ('|') para um autômato finito", 0))
+                continue
+            inicio = time.perf_counter()
+            aceita = maquina.aceita(caso.entrada)
+            perfil.tempo += time.perf_counter() - inicio
+            if perfilar:
+                maquina.aceita_perfilado(caso.entrada, detalhe)
+            passou = aceita == caso.aceita
+            obtido = 'aceita' if aceita else 'rejeita'
+            passos = len(caso.entrada)
+        perfil.execucoes += 1
+        perfil.passos += passos
+        if perfilar:
+            perfil.celulas += detalhe.celulas
+            perfil.estados.update(detalhe.estados)
+            perfil.transicoes.update(detalhe.transicoes)
+        resultados.append(ResultadoCaso(caso, passou, obtido, passos))
+    return resultados, perfil
+
+
+def executar_testes(pasta, workers=None, tamanho_bloco=64, max_passos=1_000_000, max_tempo=10.0,
+                    perfilar=False):
+    """
+    Executa todos os vetores de teste da pasta em um pool de processos.
+    :param pasta: Pasta com os .jflap e .vetores (busca recursiva).
+    :param workers: Número de processos; padrão é o número de CPUs.
+    :param tamanho_bloco: Casos por tarefa enviada ao pool.
+    :param max_passos: Limite de passos por execução de MT.
+    :param max_tempo: Limite de tempo, em segundos, por execução de MT.
+    :param perfilar: Se True, conta também estados, transições e células usados.
+    :return: Dicionário {caminho do .jflap: (lista de ResultadoCaso, PerfilExecucao)}.
+             Máquinas que não puderam ser compiladas ou com arquivo de vetores
+             inválido têm (mensagem de erro, None).
+    """
+    relatorio = {}
+    tarefas = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for caminho, vetores in encontrar_maquinas(pasta):
+            try:
+                _compilar(caminho)  # valida a máquina antes de distribuir os casos
+                casos = iter(ler_vetores(vetores))
+            except ValueError as e:
+                relatorio[caminho] = (str(e), None)
+                continue
+            relatorio[caminho] = ([], PerfilExecucao())
+            while True:
+                bloco = list(islice(casos, tamanho_bloco))
+                if not bloco:
+                    break
+                tarefas.append((caminho, pool.submit(_executar_bloco, caminho, bloco, max_passos, max_tempo, perfilar)))
+        for caminho, futuro in tarefas:
+            resultados, perfil = futuro.result()
+            relatorio[caminho][0].extend(resultados)
+            relatorio[caminho][1].mesclar(perfil)
+    return relatorio
+
+
+def formatar(relatorio, pasta, top=3):
+    """
+    Formata o relatório com as falhas e o perfil de cada máquina.
+    :return: (texto, número total de falhas).
+    """
+    linhas = []
+    falhas_total = 0
+    # Máquinas mais lentas primeiro
+    ordem = sorted(relatorio.items(), key=lambda item: -(item[1][1].tempo if item[1][1] else 0))
+    for caminho, (resultados, perfil) in ordem:
+        nome = os.path.relpath(caminho, pasta)
+        if perfil is None:
+            linhas.append(f"[ERRO] {nome}: {resultados}")
+            falhas_total += 1
+            continue
+        falhas = [r for r in resultados if not r.passou]
+        falhas_total += len(falhas)
+        situacao = 'OK' if not falhas else 'FALHA'
+        linhas.append(f"[{situacao}] {nome}: {len(resultados) - len(falhas)}/{len(resultados)} casos")
+        for r in falhas:
+            esperado = 'aceita' if r.caso.aceita else 'rejeita'
+            if r.caso.saida is not None:
+                esperado += f", fita 0 = {r.caso.saida!r}"
+            linhas.append(f"    linha {r.caso.linha}: {r.caso.entrada!r} esperado {esperado}, obtido {r.obtido}")
+        for linha in perfil.resumo(top).split('\n'):
+            linhas.append("    " + linha)
+    return '\n'.join(linhas), falhas_total
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Executa vetores de teste contra as máquinas .jflap.")
+    parser.add_argument('pasta', nargs='?', default=os.path.dirname(os.path.abspath(__file__)))
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--bloco', type=int, default=64, help="Casos por tarefa enviada ao pool.")
+    parser.add_argument('--max-passos', type=int, default=1_000_000)
+    parser.add_argument('--max-tempo', type=float, default=10.0)
+    parser.add_argument('--perfil', action='store_true',
+                        help="Conta estados/transições usados (executa cada caso mais uma vez, instrumentado).")
+    parser.add_argument('--top', type=int, default=3, help="Estados/transições mais usados a mostrar.")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    relatorio = executar_testes(args.pasta, args.workers, args.bloco, args.max_passos, args.max_tempo,
+                                 args.perfil)
+    texto, falhas = formatar(relatorio, args.pasta, args.top)
+    print(texto)
+    print(f"\n{len(relatorio)} máquinas, {falhas} falhas, {time.perf_counter() - inicio:.2f}s")
+    raise SystemExit(1 if falhas else 0)
@@ -0,0 +1,507 @@
+# Simulador de Máquinas de Turing multifita para os arquivos .jflap do tipo
+# 'turing'. As transições são compiladas para uma tabela
+# (estado, símbolos sob as cabeças) -> ação, as fitas são bytearrays com
+# símbolos internados como inteiros e sequências repetitivas são executadas de
+# uma vez: em uma fita, varreduras (laços que só andam sobre a fita sem alterá-la);
+# com várias fitas, repetições da mesma transição enquanto as cabeças que andam
+# continuam lendo o mesmo símbolo (ex.: copiar um bloco de 'a' para outra fita).
+
+import re
+import sys
+import time
+from collections import Counter
+
+from jflap import ler_jflap
+
+BRANCO = 0  # código interno do símbolo branco
+
+
+class ResultadoMT:
+    """
+    Resultado da execução de uma Máquina de Turing.
+    - aceita: True se a máquina chegou a um estado final
+    - motivo: 'final', 'parou' (sem transição), 'laco' (configuração repetida
+      ou varredura infinita), 'limite_passos' ou 'limite_tempo'
+    - passos: número de transições executadas
+    - estado: nome do estado em que a execução terminou
+    - fitas: conteúdo de cada fita, sem os brancos das extremidades
+    - cabecas: posição de cada cabeça relativa ao início do conteúdo
+    """
+    def __init__(self, aceita, motivo, passos, estado, fitas, cabecas):
+        self.aceita = aceita
+        self.motivo = motivo
+        self.passos = passos
+        self.estado = estado
+        self.fitas = fitas
+        self.cabecas = cabecas
+
+    def __repr__(self):
+        return (f"ResultadoMT(aceita={self.aceita}, motivo={self.motivo!r}, "
+                f"passos={self.passos}, estado={self.estado!r}, fitas={self.fitas})")
+
+
+class PerfilExecucao:
+    """
+    Perfil acumulado de execuções de uma máquina.
+    - execucoes: número de entradas executadas
+    - passos: total de transições executadas
+    - tempo: tempo total de parede, em segundos
+    - celulas: total de células de fita visitadas pelas cabeças
+    - estados: Counter {nome do estado: vezes em que uma transição saiu dele}
+    - transicoes: Counter {descrição da transição: vezes em que foi usada}
+    """
+    def __init__(self):
+        self.execucoes = 0
+        self.passos = 0
+        self.tempo = 0.0
+        self.celulas = 0
+        self.estados = Counter()
+        self.transicoes = Counter()
+
+    def mesclar(self, outro):
+        """Soma outro perfil a este (ex.: perfis vindos de processos diferentes)."""
+        self.execucoes += outro.execucoes
+        self.passos += outro.passos
+        self.tempo += outro.tempo
+        self.celulas += outro.celulas
+        self.estados.update(outro.estados)
+        self.transicoes.update(outro.transicoes)
+
+    def resumo(self, n=3):
+        """
+        Formata o perfil como texto.
+        :param n: Quantidade de estados e transições mais usados a mostrar.
+        """
+        celulas = f"{self.celulas} células, " if self.celulas else ""
+        linhas = [f"{self.execucoes} execuções, {self.passos} passos, {celulas}{self.tempo:.4f}s"]
+        if self.estados:
+            linhas.append("estados mais usados: " + ', '.join(
+                f"{nome} ({vezes})" for nome, vezes in self.estados.most_common(n)))
+        if self.transicoes:
+            linhas.append("transições mais usadas: " + ', '.join(
+                f"{nome} ({vezes})" for nome, vezes in self.transicoes.most_common(n)))
+        return '\n'.join(linhas)
+
+
+class _Tabela(dict):
+    """Tabela esparsa de transições: chaves ausentes não têm ação."""
+    def __missing__(self, chave):
+        return None
+
+
+class MaquinaTuring:
+    """
+    Máquina de Turing compilada.
+    - nomes: nome de cada estado (índice inteiro)
+    - simbolos: símbolo de cada código; o código 0 é o branco
+    - tabela[estado * K**fitas + código combinado] = (próximo estado, escritas, movimentos)
+    """
+    def __init__(self, maquina):
+        if maquina.tipo != 'turing':
+            raise ValueError(f"Esperada Máquina de Turing ('turing'), recebido '{maquina.tipo}'.")
+        self.fitas = maquina.fitas
+        self.nomes = []
+        self.indice_estado = {}
+        for id_estado in maquina.estados:
+            self.indice_estado[id_estado] = len(self.nomes)
+            self.nomes.append(maquina.estados[id_estado])
+        self.inicial = self.indice_estado.get(maquina.inicial)
+        self.finais = bytes(1 if i in maquina.finais else 0 for i in maquina.estados)
+
+        # Internação dos símbolos: branco = 0; tags vazias também são branco
+        self.branco = maquina.branco
+        self.simbolos = [maquina.branco]
+        self.codigo = {maquina.branco: BRANCO, '': BRANCO}
+        for t in maquina.transicoes:
+            for campo, valor in t.items():
+                if campo.startswith(('read', 'write')) and valor not in self.codigo:
+                    self.codigo[valor] = len(self.simbolos)
+                    self.simbolos.append(valor)
+        if len(self.simbolos) > 256:
+            raise ValueError("Alfabeto da fita maior que 256 símbolos.")
+        self.K = len(self.simbolos)
+
+        movimento = {'R': 1, 'L': -1, 'S': 0}
+        self.tabela = _Tabela()
+        for t in maquina.transicoes:
+            q = self.indice_estado[t['from']]
+            lidos = [self.codigo[t.get(f'read{i}', '')] for i in range(self.fitas)]
+            escritos = bytes(self.codigo[t.get(f'write{i}', '')] for i in range(self.fitas))
+            movimentos = tuple(movimento[t.get(f'move{i}', 'S')] for i in range(self.fitas))
+            chave = self._chave(q, lidos)
+            acao = (self.indice_estado[t['to']], escritos, movimentos)
+            if chave in self.tabela and self.tabela[chave] != acao:
+                simbolos = ', '.join(self.simbolos[s] for s in lidos)
+                raise ValueError(f"Máquina não determinística: estado {self.nomes[q]} "
+                                 f"lendo ({simbolos}) tem mais de uma transição.")
+            self.tabela[chave] = acao
+
+        if self.fitas == 1:
+            self._preparar_varreduras()
+        else:
+            self._preparar_repeticoes()
+
+    def _chave(self, q, lidos):
+        """Combina estado e símbolos lidos em um único inteiro."""
+        chave = q
+        for s in lidos:
+            chave = chave * self.K + s
+        return chave
+
+    def _decompor(self, chave):
+        """Inverso de _chave: (estado, códigos lidos, da fita 0 à última)."""
+        lidos = []
+        for _ in range(self.fitas):
+            chave, s = divmod(chave, self.K)
+            lidos.insert(0, s)
+        return chave, lidos
+
+    def _preparar_varreduras(self):
+        """
+        Para cada estado q de uma fita, identifica os símbolos s cuja transição é
+        uma varredura: volta para q, reescreve s e move sempre no mesmo sentido.
+        Uma sequência desses símbolos pode ser atravessada de uma só vez.
+        """
+        self.varreduras = {}
+        for q in range(len(self.nomes)):
+            por_sentido = {1: [], -1: []}
+            for s in range(self.K):
+                acao = self.tabela[q * self.K + s]
+                if acao is not None and acao[0] == q and acao[1][0] == s and acao[2][0] != 0:
+                    por_sentido[acao[2][0]].append(s)
+            for sentido, simbolos in por_sentido.items():
+                if not simbolos:
+                    continue
+                outros = bytes(s for s in range(self.K) if s not in simbolos)
+                # Direita: regex para achar o primeiro símbolo que interrompe a varredura
+                fim = re.compile(b'[' + b''.join(re.escape(bytes([s])) for s in outros) + b']') if outros else None
+                for s in simbolos:
+                    self.varreduras[q * self.K + s] = (sentido, fim, outros, BRANCO in simbolos)
+
+    def _preparar_repeticoes(self):
+        """
+        Com várias fitas, identifica as transições que voltam ao mesmo estado, não
+        alteram o símbolo das fitas paradas e movem ao menos uma cabeça. Enquanto
+        cada fita que anda continuar lendo o mesmo símbolo, é a mesma transição que
+        se repete, então a sequência inteira pode ser executada de uma vez.
+        repeticoes[chave] = [(fita, lido, escrito, sentido, regex do fim, outros), ...]
+        só com as fitas que andam.
+        """
+        self.repeticoes = {}
+        fins = {}
+        for chave, (destino, escritos, movimentos) in self.tabela.items():
+            q, lidos = self._decompor(chave)
+            if destino != q or not any(movimentos):
+                continue
+            if any(m == 0 and e != s for s, e, m in zip(lidos, escritos, movimentos)):
+                continue
+            andam = []
+            for i, (s, e, m) in enumerate(zip(lidos, escritos, movimentos)):
+                if m == 0:
+                    continue
+                if s not in fins:
+                    # Direita: primeiro símbolo diferente de s; esquerda: rfind dos outros
+                    fins[s] = (re.compile(b'[^' + re.escape(bytes([s])) + b']'),
+                               [bytes([o]) for o in range(self.K) if o != s])
+                andam.append((i, s, bytes([e]), m) + fins[s])
+            self.repeticoes[chave] = andam
+
+    @staticmethod
+    def _sequencia(fita, h, s, sentido, fim, outros):
+        """
+        Quantas células a partir de h (inclusive), no sentido dado, contêm s.
+        :return: Comprimento, ou None se a sequência não termina (brancos até o infinito).
+        """
+        if sentido == 1:
+            m = fim.search(fita, h)
+            if m is not None:
+                return m.start() - h
+            return None if s == BRANCO else len(fita) - h
+        destino = max(fita.rfind(o, 0, h + 1) for o in outros) if outros else -1
+        if destino < 0 and s == BRANCO:
+            return None
+        return h - destino
+
+    def _fita_inicial(self, texto):
+        """Converte uma string para bytearray com os códigos dos símbolos."""
+        try:
+            return bytearray(map(self.codigo.__getitem__, texto))
+        except KeyError as e:
+            raise ValueError(f"Símbolo {e.args[0]!r} não pertence ao alfabeto da fita.") from None
+
+    def executar(self, entrada, max_passos=10_000_000, max_tempo=None,
+                 detectar_laco=True, intervalo_laco=1024, perfil=None):
+        """
+        Executa a máquina sobre a entrada.
+        :param entrada: String para a fita 0, ou lista de strings (uma por fita).
+        :param max_passos: Limite de transições executadas.
+        :param max_tempo: Limite de tempo em segundos (None = sem limite).
+        :param detectar_laco: Se True, guarda configurações periodicamente e
+                              interrompe quando uma delas se repete.
+        :param intervalo_laco: Mínimo de passos entre duas verificações de laço;
+                               o intervalo cresce com o tamanho das fitas para
+                               que o custo de cada verificação seja amortizado.
+        :param perfil: PerfilExecucao a ser atualizado. Com perfil, cada transição
+                       é executada e contada individualmente (sem macro-passos),
+                       o que é bem mais lento: use só para diagnóstico.
+        :return: Instância de ResultadoMT.
+        """
+        if isinstance(entrada, str):
+            entrada = [entrada] + [''] * (self.fitas - 1)
+        fitas = [self._fita_inicial(t) or bytearray(1) for t in entrada]
+        cabecas = [0] * self.fitas
+        if self.inicial is None:
+            return self._resultado(False, 'parou', 0, 0, fitas, cabecas)
+        if perfil is not None:
+            return self._executar_perfilado(fitas, max_passos, max_tempo, detectar_laco,
+                                            intervalo_laco, perfil)
+        if self.fitas == 1:
+            return self._executar_uma_fita(fitas, max_passos, max_tempo, detectar_laco, intervalo_laco)
+        return self._executar_multifita(fitas, max_passos, max_tempo, detectar_laco, intervalo_laco)
+
+    def _executar_uma_fita(self, fitas, max_passos, max_tempo, detectar_laco, intervalo_laco):
+        fita = fitas[0]
+        h = 0
+        q = self.inicial
+        K = self.K
+        tabela = self.tabela
+        varreduras = self.varreduras
+        finais = self.finais
+        passos = 0
+        proxima_verificacao = intervalo_laco
+        vistos = set()
+        limite_tempo = time.perf_counter() + max_tempo if max_tempo is not None else None
+
+        while True:
+            if finais[q]:
+                return self._resultado(True, 'final', passos, q, [fita], [h])
+            if passos >= max_passos:
+                return self._resultado(False, 'limite_passos', passos, q, [fita], [h])
+            chave = q * K + fita[h]
+            varredura = varreduras.get(chave)
+            if varredura is not None:
+                # Macro-passo: atravessa a sequência de símbolos da varredura
+                sentido, fim, outros, passa_branco = varredura
+                if sentido == 1:
+                    m = fim.search(fita, h) if fim is not None else None
+                    if m is None:
+                        if passa_branco:
+                            return self._resultado(False, 'laco', passos, q, [fita], [h])
+                        # Depois do fim da fita só há brancos, que interrompem a varredura
+                        destino = len(fita)
+                    else:
+                        destino = m.start()
+                    n = destino - h
+                else:
+                    destino = max(fita.rfind(bytes([s]), 0, h) for s in outros) if outros else -1
+                    if destino < 0 and passa_branco:
+                        return self._resultado(False, 'laco', passos, q, [fita], [h])
+                    n = h - destino
+                if passos + n > max_passos:
+                    n = max_passos - passos
+                    destino = h + sentido * n
+                passos += n
+                h = destino
+                if h >= len(fita):
+                    fita.extend(bytearray(len(fita) + 1))
+                elif h < 0:
+                    extra = len(fita) + 1
+                    fita[0:0] = bytearray(extra)
+                    h += extra
+            else:
+                acao = tabela[chave]
+                if acao is None:
+                    return self._resultado(False, 'parou', passos, q, [fita], [h])
+                q, escritos, movimentos = acao
+                fita[h] = escritos[0]
+                h += movimentos[0]
+                passos += 1
+                if h >= len(fita):
+                    fita.extend(bytearray(len(fita)))
+                elif h < 0:
+                    extra = len(fita)
+                    fita[0:0] = bytearray(extra)
+                    h += extra
+
+            if passos >= proxima_verificacao:
+                proxima_verificacao = passos + max(intervalo_laco, len(fita))
+                if limite_tempo is not None and time.perf_counter() > limite_tempo:
+                    return self._resultado(False, 'limite_tempo', passos, q, [fita], [h])
+                if detectar_laco and self._repetiu(vistos, q, [fita], [h]):
+                    return self._resultado(False, 'laco', passos, q, [fita], [h])
+
+    def _executar_perfilado(self, fitas, max_passos, max_tempo, detectar_laco, intervalo_laco, perfil):
+        """Executa contando cada transição e as células visitadas, e atualiza o perfil."""
+        contagem = Counter()
+        extremos = [[0, 0] for _ in fitas]
+        inicio = time.perf_counter()
+        resultado = self._executar_multifita(fitas, max_passos, max_tempo, detectar_laco,
+                                             intervalo_laco, contagem, extremos)
+        perfil.tempo += time.perf_counter() - inicio
+        perfil.execucoes += 1
+        perfil.passos += resultado.passos
+        perfil.celulas += sum(maior - menor + 1 for menor, maior in extremos)
+        for chave, vezes in contagem.items():
+            q, lidos = self._decompor(chave)
+            nome = self.nomes[q]
+            destino = self.nomes[self.tabela[chave][0]]
+            perfil.estados[nome] += vezes
+            perfil.transicoes[f"{nome} --{','.join(self.simbolos[s] for s in lidos)}--> {destino}"] += vezes
+        return resultado
+
+    def _executar_multifita(self, fitas, max_passos, max_tempo, detectar_laco, intervalo_laco,
+                            contagem=None, extremos=None):
+        """
+        Laço geral para qualquer número de fitas. Sem contagem, as transições de
+        self.repeticoes são executadas como macro-passos; com contagem, uma
+        transição por passo.
+        :param contagem: Counter opcional {chave da transição: vezes}.
+        :param extremos: Lista opcional [menor, maior] de posições absolutas
+                         visitadas por fita; exige contagem.
+        """
+        cabecas = [0] * self.fitas
+        deslocamento = [0] * self.fitas
+        q = self.inicial
+        K = self.K
+        indices = range(self.fitas)
+        tabela = self.tabela
+        repeticoes = self.repeticoes if contagem is None else {}
+        sequencia = self._sequencia
+        finais = self.finais
+        passos = 0
+        proxima_verificacao = intervalo_laco
+        vistos = set()
+        limite_tempo = time.perf_counter() + max_tempo if max_tempo is not None else None
+
+        while True:
+            if finais[q]:
+                return self._resultado(True, 'final', passos, q, fitas, cabecas)
+            if passos >= max_passos:
+                return self._resultado(False, 'limite_passos', passos, q, fitas, cabecas)
+            chave = q
+            for fita, h in zip(fitas, cabecas):
+                chave = chave * K + fita[h]
+            acao = tabela[chave]
+            if acao is None:
+                return self._resultado(False, 'parou', passos, q, fitas, cabecas)
+            repeticao = repeticoes.get(chave)
+            if repeticao is not None:
+                # Macro-passo: repete a transição até alguma fita que anda mudar de símbolo
+                n = None
+                for i, s, _, sentido, fim, outros in repeticao:
+                    k = sequencia(fitas[i], cabecas[i], s, sentido, fim, outros)
+                    if k is not None and (n is None or k < n):
+                        n = k
+                if n is None:
+                    # Todas as fitas que andam só encontram brancos: nunca sai do laço
+                    return self._resultado(False, 'laco', passos, q, fitas, cabecas)
+                n = min(n, max_passos - passos)
+                for i, s, escrito, sentido, _, _ in repeticao:
+                    fita = fitas[i]
+                    h = cabecas[i]
+                    if sentido == 1:
+                        if h + n >= len(fita):
+                            fita.extend(bytearray(max(len(fita), h + n + 1 - len(fita))))
+                        if escrito[0] != s:
+                            fita[h:h + n] = escrito * n
+                        cabecas[i] = h + n
+                    else:
+                        if h - n < 0:
+                            extra = max(len(fita), n - h)
+                            fita[0:0] = bytearray(extra)
+                            h += extra
+                            deslocamento[i] += extra
+                        if escrito[0] != s:
+                            fita[h - n + 1:h + 1] = escrito * n
+                        cabecas[i] = h - n
+                passos += n
+            else:
+                if contagem is not None:
+                    contagem[chave] += 1
+                q, escritos, movimentos = acao
+                for i in indices:
+                    fita = fitas[i]
+                    h = cabecas[i]
+                    fita[h] = escritos[i]
+                    h += movimentos[i]
+                    if 0 <= h < len(fita):
+                        cabecas[i] = h
+                    elif h < 0:
+                        extra = len(fita)
+                        fita[0:0] = bytearray(extra)
+                        cabecas[i] = h + extra
+                        deslocamento[i] += extra
+                    else:
+                        fita.extend(bytearray(len(fita)))
+                        cabecas[i] = h
+                passos += 1
+                if extremos is not None:
+                    for i in indices:
+                        posicao = cabecas[i] - deslocamento[i]
+                        if posicao < extremos[i][0]:
+                            extremos[i][0] = posicao
+                        elif posicao > extremos[i][1]:
+                            extremos[i][1] = posicao
+
+            if passos >= proxima_verificacao:
+                proxima_verificacao = passos + max(intervalo_laco, sum(len(f) for f in fitas))
+                if limite_tempo is not None and time.perf_counter() > limite_tempo:
+                    return self._resultado(False, 'limite_tempo', passos, q, fitas, cabecas)
+                if detectar_laco and self._repetiu(vistos, q, fitas, cabecas):
+                    return self._resultado(False, 'laco', passos, q, fitas, cabecas)
+
+    @staticmethod
+    def _normalizar(fitas, cabecas):
+        """Remove os brancos das extremidades e ajusta as cabeças ao novo início."""
+        conteudos = []
+        posicoes = []
+        for fita, h in zip(fitas, cabecas):
+            inicio = 0
+            while inicio < len(fita) and fita[inicio] == BRANCO:
+                inicio += 1
+            conteudos.append(bytes(fita[inicio:]).rstrip(b'\x00'))
+            posicoes.append(h - inicio)
+        return conteudos, posicoes
+
+    def _repetiu(self, vistos, q, fitas, cabecas, limite=10000):
+        """
+        Verifica se a configuração atual já apareceu em uma verificação anterior.
+        Dentro de um ciclo as fitas não crescem, então o intervalo entre as
+        verificações fica constante e um ciclo de período p é detectado após no
+        máximo p verificações.
+        """
+        conteudos, posicoes = self._normalizar(fitas, cabecas)
+        configuracao = (q, tuple(conteudos), tuple(posicoes))
+        if configuracao in vistos:
+            return True
+        if len(vistos) >= limite:
+            vistos.clear()
+        vistos.add(configuracao)
+        return False
+
+    def _resultado(self, aceita, motivo, passos, q, fitas, cabecas):
+        conteudos, posicoes = self._normalizar(fitas, cabecas)
+        texto = [''.join(map(self.simbolos.__getitem__, c)) for c in conteudos]
+        return ResultadoMT(aceita, motivo, passos, self.nomes[q] if self.nomes else None, texto, posicoes)
+
+
+def carregar(caminho):
+    """
+    Lê um arquivo .jflap e compila a Máquina de Turing.
+    :param caminho: Caminho do arquivo .jflap.
+    :return: Instância de MaquinaTuring.
+    """
+    return MaquinaTuring(ler_jflap(caminho))
+
+
+if __name__ == '__main__':
+    # Uso: python turing.py arquivo.jflap entrada [entrada da fita 2 ...]
+    if len(sys.argv) < 3:
+        print("Uso: python turing.py arquivo.jflap entrada [entradas das outras fitas...]")
+        raise SystemExit(1)
+    mt = carregar(sys.argv[1])
+    entradas = sys.argv[2:]
+    inicio = time.perf_counter()
+    resultado = mt.executar(entradas[0] if len(entradas) == 1 else entradas)
+    print(resultado)
+    print(f"Tempo: {time.perf_counter() - inicio:.4f}s")
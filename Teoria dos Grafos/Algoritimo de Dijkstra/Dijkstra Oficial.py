@@ -3,8 +3,99 @@
 #       Após calcular o custo, o algoritmo deve mostrar ao usuário a rota que oferece o menor custo
 #       Não Utilizar bibliotecas externas (a não ser para UX/UI)
 
+import argparse
+import json
+import random
+import time
+from heapq import heappush, heappop
+from itertools import count
+
 import tkinter as tk
-from tkinter import simpledialog, messagebox, scrolledtext
+from tkinter import simpledialog, messagebox, scrolledtext, filedialog
+
+class EstatisticasDijkstra:
+    """
+    Contadores e tempos de uma chamada de Grafo.dijkstra.
+    - selecoes: vértices escolhidos (fixados) pela varredura de menor distância
+    - relaxacoes: arestas examinadas a partir de vértices fixados
+    - reducoes: relaxações que diminuíram dist[viz]
+    - tempo_selecao / tempo_relaxacao / tempo_total: segundos
+    """
+    CAMPOS = ('selecoes', 'relaxacoes', 'reducoes', 'tempo_selecao', 'tempo_relaxacao', 'tempo_total')
+
+    def __init__(self):
+        self.zerar()
+
+    def zerar(self):
+        """Volta todos os contadores e tempos a zero."""
+        self.selecoes = 0
+        self.relaxacoes = 0
+        self.reducoes = 0
+        self.tempo_selecao = 0.0
+        self.tempo_relaxacao = 0.0
+        self.tempo_total = 0.0
+
+    def somar(self, outra):
+        """Acrescenta os contadores e tempos de outra EstatisticasDijkstra a esta."""
+        for campo in self.CAMPOS:
+            setattr(self, campo, getattr(self, campo) + getattr(outra, campo))
+
+    def como_dict(self):
+        return {campo: getattr(self, campo) for campo in self.CAMPOS}
+
+    def __str__(self):
+        return (f"{self.selecoes} seleções, {self.relaxacoes} relaxações "
+                f"({self.reducoes} reduções) em {self.tempo_total * 1000:.3f} ms "
+                f"[seleção {self.tempo_selecao * 1000:.3f} ms, relaxação {self.tempo_relaxacao * 1000:.3f} ms]")
+
+
+class MetricasDijkstra:
+    """
+    Acumula as EstatisticasDijkstra de várias chamadas e exporta em texto ou JSON.
+    Atribua uma instância a Grafo.metricas para que toda chamada de dijkstra seja medida.
+    """
+    def __init__(self):
+        self.chamadas = 0
+        self.total = EstatisticasDijkstra()
+        self.ultima = None  # estatísticas da chamada mais recente
+
+    def registrar(self, estatisticas):
+        """Soma as estatísticas de uma única chamada ao acumulado."""
+        self.chamadas += 1
+        self.total.somar(estatisticas)
+        self.ultima = estatisticas
+
+    def limpar(self):
+        """Descarta tudo o que foi acumulado."""
+        self.chamadas = 0
+        self.total.zerar()
+        self.ultima = None
+
+    def como_dict(self):
+        dados = {'chamadas': self.chamadas}
+        dados.update(self.total.como_dict())
+        return dados
+
+    def texto(self):
+        """Resumo legível das métricas acumuladas."""
+        if not self.chamadas:
+            return "Nenhuma chamada de Dijkstra medida."
+        media = self.total.tempo_total / self.chamadas * 1000
+        return (f"{self.chamadas} chamadas, média {media:.3f} ms\n"
+                f"Total: {self.total}")
+
+    def json(self, caminho=None):
+        """
+        Exporta as métricas em JSON.
+        :param caminho: Se informado, grava no arquivo; senão apenas retorna o texto.
+        :return: String JSON.
+        """
+        texto = json.dumps(self.como_dict(), indent=2)
+        if caminho is not None:
+            with open(caminho, 'w', encoding='utf-8') as f:
+                f.write(texto)
+        return texto
+
 
 class Grafo:
     """
@@ -12,12 +103,14 @@ class Grafo:
     - vertices: dicionário {vértice: [(vizinho, peso), ...]}
     - posicoes: coordenadas (x,y) para desenhar cada vértice no canvas
     - direcionado: se True, arestas unilaterais; se False, bidirecionado
+    - metricas: MetricasDijkstra que acumula cada chamada de dijkstra, ou None
     """
     def __init__(self, direcionado=True):
         # Inicializa estruturas de dados
         self.vertices = {}     # mapeia cada vértice à sua lista de arestas
         self.posicoes = {}     # armazena coordenadas de exibição para cada vértice
         self.direcionado = direcionado   # tipo de grafo
+        self.metricas = None   # sem instrumentação por padrão
 
     def adicionar_vertice(self, v):
         """Adiciona um vértice v ao grafo, se ainda não existir."""
@@ -59,13 +152,27 @@ class Grafo:
         self.vertices.clear()
         self.posicoes.clear()
 
-    def dijkstra(self, inicio):
+    def dijkstra(self, inicio, estatisticas=None, evento=None):
         """
-        Implementação do algoritmo de Dijkstra sem uso de heapq:
+        Implementação do algoritmo de Dijkstra sem uso de heapq (seleção por varredura
+        linear; heapq só é usado na busca ponto a ponto de _busca):
         - dist: mapeia vértice → distância mínima desde início
         - prev: armazena antecessor para reconstruir caminho
         - visitados: conjunto de vértices já processados
+        Ganchos de métricas (sem nenhum deles, o laço não lê o relógio nem conta nada):
+        - estatisticas: EstatisticasDijkstra que recebe a soma dos contadores e tempos
+          desta chamada (reutilizá-la acumula várias chamadas)
+        - self.metricas: MetricasDijkstra que registra cada chamada
+        - evento: chamado como evento('fixa', u, None, dist[u]) ao fixar u e
+          evento('relaxa', u, viz, nova) a cada redução de dist[viz]
         """
+        # cada chamada mede em um objeto novo, somado/registrado no final
+        medir = estatisticas is not None or self.metricas is not None
+        if medir:
+            chamada = EstatisticasDijkstra()
+            relogio = time.perf_counter
+            inicio_total = relogio()
+
         # inicialização das distâncias
         dist = {v: float('inf') for v in self.vertices}
         prev = {v: None for v in self.vertices}
@@ -74,6 +181,8 @@ class Grafo:
 
         # enquanto houver vértices não visitados
         while len(visitados) < len(self.vertices):
+            if medir:
+                t0 = relogio()
             # escolhe vértice não visitado com menor dist[v]
             u = None
             menor = float('inf')
@@ -81,28 +190,51 @@ class Grafo:
                 if v not in visitados and dist[v] < menor:
                     menor = dist[v]
                     u = v
+            if medir:
+                t1 = relogio()
+                chamada.tempo_selecao += t1 - t0
             # se não encontrou vértice alcançável, encerra
             if u is None:
                 break
             visitados.add(u)
+            if medir:
+                chamada.selecoes += 1
+            if evento is not None:
+                evento('fixa', u, None, dist[u])
 
             # relaxa arestas saindo de u
+            if medir:
+                t1 = relogio()
             for (viz, peso) in self.vertices[u]:
                 if viz in visitados:
                     continue
+                if medir:
+                    chamada.relaxacoes += 1
                 nova = dist[u] + peso
                 if nova < dist[viz]:
                     dist[viz] = nova
                     prev[viz] = u
-
+                    if medir:
+                        chamada.reducoes += 1
+                    if evento is not None:
+                        evento('relaxa', u, viz, nova)
+            if medir:
+                chamada.tempo_relaxacao += relogio() - t1
+
+        if medir:
+            chamada.tempo_total += relogio() - inicio_total
+            if estatisticas is not None:
+                estatisticas.somar(chamada)
+            if self.metricas is not None:
+                self.metricas.registrar(chamada)
         return dist, prev
 
-    def obter_caminhos(self, inicio):
+    def obter_caminhos(self, inicio, estatisticas=None):
         """
         Reconstrói os caminhos a partir de 'inicio' até cada vértice.
         Retorna lista de strings descrevendo rotas e custos.
         """
-        dist, prev = self.dijkstra(inicio)
+        dist, prev = self.dijkstra(inicio, estatisticas)
         resultados = []
         for dest in self.vertices:
             if dest == inicio:
@@ -122,6 +254,153 @@ class Grafo:
                 )
         return resultados
 
+    def _peso(self, origem, destino):
+        """Menor peso entre as arestas origem→destino (pode haver arestas paralelas)."""
+        return min(p for v, p in self.vertices[origem] if v == destino)
+
+    def _arvore_reversa(self, destino):
+        """
+        Árvore de menores caminhos *até* destino (Dijkstra sobre as arestas invertidas).
+        - dist_ate: mapeia vértice → custo mínimo até destino (ausente se inalcançável)
+        - prox: próximo vértice no menor caminho até destino
+        """
+        reversas = {v: [] for v in self.vertices}
+        for u, adj in self.vertices.items():
+            for (v, peso) in adj:
+                reversas[v].append((u, peso))
+        dist_ate = {destino: 0}
+        prox = {destino: None}
+        fila = [(0, 0, destino)]
+        desempate = count(1)
+        fechados = set()
+        while fila:
+            d, _, v = heappop(fila)
+            if v in fechados:
+                continue
+            fechados.add(v)
+            for (u, peso) in reversas[v]:
+                nova = d + peso
+                if nova < dist_ate.get(u, float('inf')):
+                    dist_ate[u] = nova
+                    prox[u] = v
+                    heappush(fila, (nova, next(desempate), u))
+        return dist_ate, prox
+
+    def _busca(self, origem, destino, bloqueados=(), arestas_bloqueadas=(), estimativa=None):
+        """
+        Busca ponto a ponto com parada antecipada ao fechar o destino.
+        Com 'estimativa' (custos até o destino, p. ex. de _arvore_reversa) vira um A*;
+        vértices ausentes da estimativa não alcançam o destino e são ignorados.
+        Retorna (custo, caminho) ou (inf, None) se não houver caminho.
+        """
+        dist = {origem: 0}
+        prev = {origem: None}
+        h0 = estimativa.get(origem) if estimativa is not None else 0
+        if h0 is None:
+            return float('inf'), None
+        fila = [(h0, 0, 0, origem)]
+        desempate = count(1)
+        fechados = set()
+        while fila:
+            _, _, d, u = heappop(fila)
+            if u in fechados:
+                continue
+            if u == destino:
+                seq = []
+                while u is not None:
+                    seq.append(u)
+                    u = prev[u]
+                return d, seq[::-1]
+            fechados.add(u)
+            for (viz, peso) in self.vertices[u]:
+                if viz in fechados or viz in bloqueados or (u, viz) in arestas_bloqueadas:
+                    continue
+                h = estimativa.get(viz) if estimativa is not None else 0
+                if h is None:
+                    continue
+                nova = d + peso
+                if nova < dist.get(viz, float('inf')):
+                    dist[viz] = nova
+                    prev[viz] = u
+                    heappush(fila, (nova + h, next(desempate), nova, viz))
+        return float('inf'), None
+
+    def menor_caminho(self, origem, destino):
+        """
+        Menor caminho entre dois vértices, sem calcular a árvore inteira.
+        Retorna (custo, [origem, ..., destino]) ou (inf, None).
+        """
+        return self._busca(origem, destino)
+
+    def k_menores_caminhos(self, origem, destino, k=None):
+        """
+        Gerador dos caminhos simples de origem a destino em ordem de custo (algoritmo de Yen).
+        Cada iteração produz (custo, caminho); quem precisa só de 2 ou 3 alternativas
+        para de iterar e não paga pelas demais (k limita o total, se informado).
+
+        A árvore de menores caminhos até o destino é calculada uma vez e reaproveitada:
+        dá o primeiro caminho direto, serve de estimativa (A*) para os desvios e,
+        quando o caminho da árvore a partir do vértice de desvio não usa nada bloqueado,
+        o desvio sai dela sem busca nenhuma.
+        """
+        if origem not in self.vertices or destino not in self.vertices:
+            raise KeyError("Vértice não cadastrado.")
+        dist_ate, prox = self._arvore_reversa(destino)
+        if origem not in dist_ate:
+            return
+
+        def desvio(spur, bloqueados, arestas_bloqueadas):
+            # tenta o caminho da árvore antes de buscar
+            seq = [spur]
+            u = prox[spur]
+            if (spur, u) not in arestas_bloqueadas:
+                while u is not None and u not in bloqueados:
+                    seq.append(u)
+                    u = prox[u]
+                if u is None:
+                    return dist_ate[spur], seq
+            return self._busca(spur, destino, bloqueados, arestas_bloqueadas, dist_ate)
+
+        custo, caminho = desvio(origem, (), ())
+        encontrados = []            # caminhos já produzidos
+        candidatos = []             # heap de (custo, desempate, caminho)
+        vistos = {tuple(caminho)}
+        desempate = count()
+        while True:
+            yield custo, caminho
+            encontrados.append(caminho)
+            if k is not None and len(encontrados) >= k:
+                return
+            # desvios a partir de cada vértice do último caminho produzido
+            custo_raiz = 0
+            for i in range(len(caminho) - 1):
+                raiz = caminho[:i + 1]
+                arestas_bloqueadas = {(p[i], p[i + 1]) for p in encontrados
+                                      if len(p) > i + 1 and p[:i + 1] == raiz}
+                custo_spur, resto = desvio(caminho[i], set(raiz[:-1]), arestas_bloqueadas)
+                if resto is not None:
+                    novo = raiz[:-1] + resto
+                    chave = tuple(novo)
+                    if chave not in vistos:
+                        vistos.add(chave)
+                        heappush(candidatos, (custo_raiz + custo_spur, next(desempate), novo))
+                custo_raiz += self._peso(caminho[i], caminho[i + 1])
+            if not candidatos:
+                return
+            custo, _, caminho = heappop(candidatos)
+
+    def obter_alternativas(self, origem, destino, k=3):
+        """
+        Descreve até k rotas alternativas de origem a destino, da mais barata à mais cara.
+        Retorna lista de strings no mesmo formato de obter_caminhos.
+        """
+        resultados = []
+        for i, (custo, seq) in enumerate(self.k_menores_caminhos(origem, destino, k), 1):
+            resultados.append(f"Rota {i} {origem}→{destino}: {'→'.join(seq)} (custo {custo:.0f})")
+        if not resultados:
+            resultados.append(f"Não há caminho de {origem} para {destino}.")
+        return resultados
+
 #
 
 ## Modificações na Classe `Interface`
@@ -136,10 +415,11 @@ class Interface:
     """
     def __init__(self, master):
         self.master = master
-        master.title("Dijkstra Interativo - Sem heapq")
+        master.title("Dijkstra Interativo")
 
         # Grafo e histórico de arestas para desfazer
         self.grafo = Grafo(direcionado=True)
+        self.grafo.metricas = MetricasDijkstra()  # métricas exibidas no painel
         self.history = []  # pilha de tuplas (origem, destino, peso)
         self.dragging = None  # vértice atual sendo movido
 
@@ -159,7 +439,10 @@ class Interface:
         tk.Button(ctrl, text="Desfazer Última Aresta", command=self.undo_aresta).pack(fill=tk.X, pady=2)
         tk.Button(ctrl, text="Limpar Grafo", command=self.clear_graph).pack(fill=tk.X, pady=2)
         tk.Button(ctrl, text="Dijkstra", command=self.run).pack(fill=tk.X, pady=2)
+        tk.Button(ctrl, text="Rotas Alternativas", command=self.run_alternativas).pack(fill=tk.X, pady=2)
         tk.Button(ctrl, text="Vertices", command=self.show_verts).pack(fill=tk.X, pady=2)
+        tk.Button(ctrl, text="Métricas", command=self.show_metricas).pack(fill=tk.X, pady=2)
+        tk.Button(ctrl, text="Exportar Métricas", command=self.export_metricas).pack(fill=tk.X, pady=2)
         # Área de texto para logs e resultados
         self.text = scrolledtext.ScrolledText(ctrl, width=30, height=20)
         self.text.pack(pady=5)
@@ -354,18 +637,89 @@ class Interface:
         if not start or start not in self.grafo.vertices:
             return
         self.text.insert(tk.END, '\n--- Dijkstra ---\n')
-        for line in self.grafo.obter_caminhos(start):
+        estatisticas = EstatisticasDijkstra()
+        for line in self.grafo.obter_caminhos(start, estatisticas):
+            self.text.insert(tk.END, line + '\n')
+        self.text.insert(tk.END, f'Estatísticas: {estatisticas}\n')
+
+    def run_alternativas(self):
+        """
+        Solicita origem, destino e quantidade de rotas e imprime as
+        k menores rotas (Yen) no painel de texto.
+        """
+        start = simpledialog.askstring('Origem', 'Vértice de origem:')
+        if not start or start not in self.grafo.vertices:
+            return
+        end = simpledialog.askstring('Destino', 'Vértice de destino:')
+        if not end or end not in self.grafo.vertices:
+            return
+        k = simpledialog.askinteger('Rotas', 'Quantidade de rotas:', initialvalue=3, minvalue=1)
+        if not k:
+            return
+        self.text.insert(tk.END, f'\n--- {k} menores rotas ---\n')
+        for line in self.grafo.obter_alternativas(start, end, k):
             self.text.insert(tk.END, line + '\n')
 
+    def show_metricas(self):
+        """Exibe as métricas acumuladas de todas as execuções de Dijkstra."""
+        self.text.insert(tk.END, '\n--- Métricas ---\n' + self.grafo.metricas.texto() + '\n')
+
+    def export_metricas(self):
+        """Grava as métricas acumuladas em um arquivo JSON escolhido pelo usuário."""
+        caminho = filedialog.asksaveasfilename(defaultextension='.json',
+                                               filetypes=[('JSON', '*.json')])
+        if not caminho:
+            return
+        self.grafo.metricas.json(caminho)
+        self.text.insert(tk.END, f'Métricas exportadas para {caminho}\n')
+
     def show_verts(self):
         """Exibe todos os vértices cadastrados no painel de texto."""
         verts = ','.join(self.grafo.vertices.keys())
         self.text.insert(tk.END, 'Vertices: ' + verts + '\n')
 
+def medir_grafo_aleatorio(n, grau, consultas, peso_max=100, semente=0):
+    """
+    Executa Dijkstra em um grafo aleatório, sem interface, medindo cada chamada.
+    :param n: Quantidade de vértices.
+    :param grau: Arestas por vértice.
+    :param consultas: Quantidade de vértices iniciais sorteados.
+    :return: MetricasDijkstra com as chamadas acumuladas.
+    """
+    rng = random.Random(semente)
+    grafo = Grafo(direcionado=True)
+    for v in range(n):
+        grafo.adicionar_vertice(str(v))
+    for u in range(n):
+        for _ in range(grau):
+            grafo.adicionar_aresta(str(u), str(rng.randrange(n)), rng.randint(1, peso_max))
+    grafo.metricas = MetricasDijkstra()
+    for inicio in rng.sample(list(grafo.vertices), min(consultas, n)):
+        grafo.dijkstra(inicio)
+    return grafo.metricas
+
+
 if __name__ == '__main__':
-    root = tk.Tk()
-    app = Interface(root)
-    root.mainloop()
+    parser = argparse.ArgumentParser(description="Dijkstra interativo (abre a interface sem --metricas).")
+    parser.add_argument('--metricas', action='store_true',
+                        help="Sem interface: mede Dijkstra em um grafo aleatório e imprime as métricas.")
+    parser.add_argument('-n', type=int, default=1000, help="Vértices do grafo aleatório.")
+    parser.add_argument('--grau', type=int, default=4, help="Arestas por vértice.")
+    parser.add_argument('--consultas', type=int, default=10, help="Chamadas de Dijkstra.")
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--json', default=None, help="Também grava as métricas neste arquivo JSON.")
+    args = parser.parse_args()
+
+    if args.metricas:
+        metricas = medir_grafo_aleatorio(args.n, args.grau, args.consultas, semente=args.semente)
+        print(metricas.texto())
+        if args.json is not None:
+            metricas.json(args.json)
+            print(f"Métricas exportadas para {args.json}")
+    else:
+        root = tk.Tk()
+        app = Interface(root)
+        root.mainloop()
 
 
 
@@ -0,0 +1,84 @@
+# Escalabilidade do delta-stepping (delta_stepping.py) pelo número de processos,
+# comparado com o Grafo.dijkstra original em um grafo aleatório.
+
+import argparse
+import importlib.util
+import os
+import random
+import time
+
+from delta_stepping import DeltaStepping
+
+
+def carregar_grafo():
+    """Importa a classe Grafo de "Dijkstra Oficial.py" (o nome do arquivo tem espaço)."""
+    caminho = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Dijkstra Oficial.py')
+    spec = importlib.util.spec_from_file_location('dijkstra_oficial', caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo.Grafo
+
+
+def grafo_aleatorio(n, grau, peso_max, semente):
+    """Grafo direcionado com n vértices, ~grau arestas por vértice e pesos inteiros em [1, peso_max]."""
+    Grafo = carregar_grafo()
+    rng = random.Random(semente)
+    grafo = Grafo(direcionado=True)
+    for v in range(n):
+        grafo.adicionar_vertice(str(v))
+    for u in range(n):
+        for _ in range(grau):
+            grafo.adicionar_aresta(str(u), str(rng.randrange(n)), rng.randint(1, peso_max))
+    return grafo
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark do delta-stepping paralelo.")
+    parser.add_argument('-n', type=int, default=200_000, help="Quantidade de vértices.")
+    parser.add_argument('--grau', type=int, default=8, help="Arestas por vértice.")
+    parser.add_argument('--peso-max', type=int, default=100)
+    parser.add_argument('--fontes', type=int, default=3, help="Consultas por configuração.")
+    parser.add_argument('--processos', type=int, nargs='+', default=None,
+                        help="Quantidades de processos a testar (padrão: 0, 1, 2, 4, ... até as CPUs).")
+    parser.add_argument('--delta', type=float, default=None, help="Largura dos baldes (padrão: automática).")
+    parser.add_argument('--verificar', action='store_true',
+                        help="Compara dist/prev com Grafo.dijkstra (O(V²): use só com n pequeno).")
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    processos = args.processos
+    if processos is None:
+        processos = [0]
+        p = 1
+        while p <= (os.cpu_count() or 1):
+            processos.append(p)
+            p *= 2
+
+    grafo = grafo_aleatorio(args.n, args.grau, args.peso_max, args.semente)
+    fontes = random.Random(args.semente).sample(list(grafo.vertices), min(args.fontes, args.n))
+
+    print(f"{args.n} vértices, {args.n * args.grau} arestas, {len(fontes)} fontes")
+    print(f"{'processos':>10}{'delta':>10}{'s/consulta':>12}{'speedup':>10}")
+    referencia = None
+    referencias = {}  # Grafo.dijkstra de cada fonte, calculado uma vez
+    for p in processos:
+        with DeltaStepping(grafo, processos=p, delta=args.delta) as ds:
+            resultados = []
+            ds.dijkstra(fontes[0])  # aquecimento (pool e caches) fora da medição
+            inicio = time.perf_counter()
+            for s in fontes:
+                resultados.append(ds.dijkstra(s))
+            tempo = (time.perf_counter() - inicio) / len(fontes)
+            delta = ds.delta
+        # a referência O(V²) roda fora da medição
+        if args.verificar:
+            for s, resultado in zip(fontes, resultados):
+                if s not in referencias:
+                    referencias[s] = grafo.dijkstra(s)
+                if resultado != referencias[s]:
+                    raise SystemExit(f"Divergência com Grafo.dijkstra a partir de {s}.")
+        referencia = referencia or tempo
+        print(f"{p:>10}{delta:>10.2f}{tempo:>12.3f}{referencia / tempo:>10.2f}")
+
+    if args.verificar:
+        print("dist/prev idênticos aos de Grafo.dijkstra.")
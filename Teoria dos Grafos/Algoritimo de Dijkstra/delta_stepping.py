@@ -0,0 +1,251 @@
+#   Caminhos mínimos por delta-stepping (Meyer & Sanders) em paralelo
+#       O grafo (Grafo de "Dijkstra Oficial.py", ou qualquer objeto com o mesmo
+#       atributo 'vertices') é copiado uma vez para um CSR em memória compartilhada.
+#       Os vértices ficam em baldes de largura delta pela distância provisória; as
+#       arestas leves (peso <= delta) e pesadas de cada balde são relaxadas por
+#       processos trabalhadores, que só leem o CSR e as distâncias e devolvem
+#       pedidos de relaxação; o processo principal aplica os pedidos.
+#       Apenas a biblioteca padrão é usada.
+
+import os
+from array import array
+from heapq import heappush, heappop
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+
+INF = float('inf')
+
+# Abaixo desta quantidade de vértices no balde, relaxar no próprio processo
+# é mais barato que enviar a tarefa aos trabalhadores
+MINIMO_PARALELO = 2048
+
+
+class _CSR:
+    """
+    Grafo em formato CSR (compressed sparse row) dentro de memória compartilhada.
+    - nomes: lista com o vértice de cada índice (mesma ordem de grafo.vertices)
+    - indice: dicionário vértice → índice
+    - inicio: inicio[u]..inicio[u+1] delimitam as arestas de u (int64)
+    - destino, peso: vértice de chegada (int64) e peso (double) de cada aresta
+    - dist: vetor de distâncias (double), lido pelos trabalhadores
+    - pesos_originais: os pesos como estavam no grafo (int/float), só no processo principal
+    """
+    def __init__(self, grafo):
+        self.nomes = list(grafo.vertices)
+        self.indice = {v: i for i, v in enumerate(self.nomes)}
+        n = len(self.nomes)
+        m = sum(len(adj) for adj in grafo.vertices.values())
+        self._blocos = []
+        self.inicio = self._alocar('q', n + 1)
+        self.destino = self._alocar('q', m)
+        self.peso = self._alocar('d', m)
+        self.dist = self._alocar('d', n)
+        self.pesos_originais = []
+        k = 0
+        for u, v in enumerate(self.nomes):
+            self.inicio[u] = k
+            for (viz, p) in grafo.vertices[v]:
+                if p < 0:
+                    self.fechar()
+                    raise ValueError("Delta-stepping (assim como Dijkstra) exige pesos não negativos.")
+                self.destino[k] = self.indice[viz]
+                self.peso[k] = p
+                self.pesos_originais.append(p)
+                k += 1
+        self.inicio[n] = k
+
+    def _alocar(self, tipo, tamanho):
+        bloco = SharedMemory(create=True, size=max(1, tamanho) * 8)
+        self._blocos.append(bloco)
+        return bloco.buf.cast(tipo)[:tamanho]
+
+    def nomes_blocos(self):
+        return [bloco.name for bloco in self._blocos]
+
+    def fechar(self):
+        for nome in ('inicio', 'destino', 'peso', 'dist'):
+            visao = self.__dict__.pop(nome, None)
+            if visao is not None:
+                visao.release()
+        for bloco in self._blocos:
+            bloco.close()
+            bloco.unlink()
+        self._blocos = []
+
+
+# Estado de cada processo trabalhador: (inicio, destino, peso, dist, blocos)
+_trabalhador = None
+
+
+def _iniciar_trabalhador(nomes, tamanhos):
+    global _trabalhador
+    blocos = [SharedMemory(name=nome) for nome in nomes]
+    visoes = [bloco.buf.cast(tipo)[:t] for bloco, tipo, t in zip(blocos, 'qqdd', tamanhos)]
+    _trabalhador = (*visoes, blocos)
+
+
+def _relaxar(inicio, destino, peso, dist, vertices, delta, leves):
+    """
+    Gera os pedidos de relaxação das arestas leves (ou pesadas) dos vértices dados.
+    :return: Lista [(vizinho, nova distância), ...], só com melhorias sobre dist.
+    """
+    pedidos = {}
+    for u in vertices:
+        du = dist[u]
+        for k in range(inicio[u], inicio[u + 1]):
+            p = peso[k]
+            if (p <= delta) != leves:
+                continue
+            v = destino[k]
+            nova = du + p
+            if nova < dist[v] and nova < pedidos.get(v, INF):
+                pedidos[v] = nova
+    return list(pedidos.items())
+
+
+def _relaxar_trabalhador(vertices, delta, leves):
+    inicio, destino, peso, dist, _ = _trabalhador
+    return _relaxar(inicio, destino, peso, dist, vertices, delta, leves)
+
+
+def delta_automatico(csr):
+    """
+    Escolhe delta ~ peso máximo / grau médio (Meyer & Sanders): baldes estreitos o
+    bastante para poucas reinserções e largos o bastante para ter trabalho paralelo.
+    """
+    n = len(csr.nomes)
+    m = len(csr.peso)
+    positivos = [p for p in csr.peso if p > 0]
+    if not positivos:
+        return 1.0
+    grau_medio = max(1.0, m / max(1, n))
+    return max(max(positivos) / grau_medio, min(positivos))
+
+
+class DeltaStepping:
+    """
+    Caminhos mínimos de fonte única por delta-stepping com processos trabalhadores.
+    Use como gerenciador de contexto (ou chame fechar()) para liberar a memória
+    compartilhada e o pool:
+
+        with DeltaStepping(grafo, processos=8) as ds:
+            dist, prev = ds.dijkstra('A')
+
+    - processos: número de trabalhadores (padrão: CPUs); 0 executa tudo no processo atual
+    - delta: largura dos baldes; None escolhe automaticamente (delta_automatico)
+    """
+    def __init__(self, grafo, processos=None, delta=None):
+        self.csr = _CSR(grafo)
+        self.delta = delta if delta is not None else delta_automatico(self.csr)
+        if self.delta <= 0:
+            self.fechar()
+            raise ValueError("delta deve ser positivo.")
+        self.processos = os.cpu_count() if processos is None else processos
+        self._pool = None
+        if self.processos > 0:
+            tamanhos = [len(self.csr.inicio), len(self.csr.destino), len(self.csr.peso), len(self.csr.dist)]
+            self._pool = get_context().Pool(self.processos, _iniciar_trabalhador,
+                                            (self.csr.nomes_blocos(), tamanhos))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def fechar(self):
+        """Encerra o pool e libera a memória compartilhada."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        if self.csr is not None:
+            self.csr.fechar()
+            self.csr = None
+
+    def _pedidos(self, vertices, leves):
+        """Relaxa as arestas dos vértices, dividindo o trabalho entre os processos."""
+        csr = self.csr
+        if self._pool is None or len(vertices) < MINIMO_PARALELO:
+            return _relaxar(csr.inicio, csr.destino, csr.peso, csr.dist, vertices, self.delta, leves)
+        tamanho = -(-len(vertices) // self.processos)
+        partes = [vertices[i:i + tamanho] for i in range(0, len(vertices), tamanho)]
+        pedidos = []
+        for parte in self._pool.starmap(_relaxar_trabalhador, [(p, self.delta, leves) for p in partes]):
+            pedidos.extend(parte)
+        return pedidos
+
+    def distancias(self, inicio):
+        """
+        Calcula as distâncias mínimas a partir de 'inicio'.
+        :return: Vetor (array 'd') indexado como self.csr.nomes; INF se inalcançável.
+        """
+        csr = self.csr
+        dist = csr.dist
+        delta = self.delta
+        for i in range(len(dist)):
+            dist[i] = INF
+        baldes = {}
+
+        def aplicar(pedidos):
+            for v, nova in pedidos:
+                atual = dist[v]
+                if nova < atual:
+                    if atual != INF:
+                        baldes.get(int(atual // delta), set()).discard(v)
+                    dist[v] = nova
+                    baldes.setdefault(int(nova // delta), set()).add(v)
+
+        aplicar([(csr.indice[inicio], 0.0)])
+        while baldes:
+            i = min(baldes)
+            fixados = set()
+            # arestas leves podem reinserir vértices no mesmo balde
+            while baldes.get(i):
+                atual = list(baldes.pop(i))
+                fixados.update(atual)
+                aplicar(self._pedidos(atual, True))
+            baldes.pop(i, None)
+            aplicar(self._pedidos(list(fixados), False))
+        return array('d', dist)
+
+    def dijkstra(self, inicio):
+        """
+        Mesmo resultado de Grafo.dijkstra: dicionários dist e prev idênticos,
+        inclusive nos empates. As distâncias vêm do delta-stepping; em seguida
+        a ordem de fixação de Grafo.dijkstra (menor distância, empate pela ordem
+        de inserção dos vértices) é reproduzida percorrendo só as arestas justas
+        (dist[u] + peso == dist[v]), o que define prev como o Dijkstra original.
+        """
+        d = self.distancias(inicio)
+        csr = self.csr
+        nomes = csr.nomes
+        inicio_i = csr.indice[inicio]
+        prev_i = [-1] * len(nomes)
+        aresta_prev = [-1] * len(nomes)   # índice da aresta que define prev
+        pronto = bytearray(len(nomes))
+        pronto[inicio_i] = 1
+        ordem = []
+        # fila de prioridade por (distância, índice): repete a varredura linear
+        fila = [(0.0, inicio_i)]
+        while fila:
+            du, u = heappop(fila)
+            ordem.append(u)
+            for k in range(csr.inicio[u], csr.inicio[u + 1]):
+                v = csr.destino[k]
+                if not pronto[v] and du + csr.peso[k] == d[v]:
+                    pronto[v] = 1
+                    prev_i[v] = u
+                    aresta_prev[v] = k
+                    heappush(fila, (d[v], v))
+
+        dist = {v: INF for v in nomes}
+        prev = {v: None for v in nomes}
+        dist[inicio] = 0
+        # refaz as somas com os pesos originais, na ordem de fixação, para que os
+        # valores (e tipos) sejam exatamente os somados por Grafo.dijkstra
+        for v in ordem[1:]:
+            u = nomes[prev_i[v]]
+            dist[nomes[v]] = dist[u] + csr.pesos_originais[aresta_prev[v]]
+            prev[nomes[v]] = u
+        return dist, prev
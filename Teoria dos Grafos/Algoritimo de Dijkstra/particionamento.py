@@ -0,0 +1,424 @@
+#   Particionamento do grafo e armazenamento em disco para rotas fora da memória
+#       - particionar: divide os vértices em k partes (ordem de BFS + propagação de rótulos)
+#       - salvar_particionado: grava cada parte (shard) como um arquivo binário em CSR,
+#         lido por mmap, mais a sobreposição: distâncias borda→borda dentro de cada
+#         shard e as arestas que cruzam shards
+#       - GrafoEmDisco: lê os shards sob demanda com um cache LRU; consultas entre dois
+#         vértices usam só os shards da origem e do destino mais a sobreposição
+#       Apenas a biblioteca padrão é usada.
+#
+#   Formato da pasta:
+#       particao.json      metadados (n, k, arquivos)
+#       nomes.json         nome de cada vértice, na ordem dos ids globais
+#       dono.bin           int32 por vértice: shard do vértice
+#       posicao.bin        int64 por vértice: índice local dentro do shard
+#       shard_NNNN.bin     cabeçalho (n_local, m) + globais, inicio, destino (int64) e peso (double)
+#       sobreposicao.bin   mesmo layout de um shard, sobre os vértices de borda
+
+import json
+import mmap
+import os
+import random
+import struct
+from array import array
+from collections import OrderedDict, deque
+from heapq import heappush, heappop
+
+INF = float('inf')
+CABECALHO = struct.Struct('<qq')
+
+
+def particionar(grafo, k, iteracoes=10, desbalanceamento=0.1, semente=0):
+    """
+    Divide os vértices em k partes com poucas arestas entre partes.
+    Parte da ordem de uma BFS (vértices próximos ficam na mesma parte) e refina por
+    propagação de rótulos: cada vértice vai para a parte mais comum entre seus
+    vizinhos, desde que ela não passe da capacidade.
+    :param grafo: Grafo (ou objeto com 'vertices' no mesmo formato).
+    :param k: Quantidade de partes.
+    :param desbalanceamento: Folga de tamanho permitida sobre n/k.
+    :return: Lista com a parte de cada vértice, na ordem de grafo.vertices.
+    """
+    if k < 1:
+        raise ValueError("k deve ser pelo menos 1.")
+    nomes = list(grafo.vertices)
+    indice = {v: i for i, v in enumerate(nomes)}
+    n = len(nomes)
+    # a direção das arestas não importa para o corte
+    vizinhos = [[] for _ in range(n)]
+    for u, v in enumerate(nomes):
+        for (viz, _) in grafo.vertices[v]:
+            w = indice[viz]
+            if w != u:
+                vizinhos[u].append(w)
+                vizinhos[w].append(u)
+
+    ordem = []
+    visto = bytearray(n)
+    for raiz in range(n):
+        if visto[raiz]:
+            continue
+        visto[raiz] = 1
+        fila = deque([raiz])
+        while fila:
+            u = fila.popleft()
+            ordem.append(u)
+            for w in vizinhos[u]:
+                if not visto[w]:
+                    visto[w] = 1
+                    fila.append(w)
+
+    tamanho = max(1, -(-n // k))
+    dono = [0] * n
+    tamanhos = [0] * k
+    for pos, v in enumerate(ordem):
+        dono[v] = pos // tamanho
+        tamanhos[dono[v]] += 1
+    capacidade = int(tamanho * (1 + desbalanceamento))
+
+    rng = random.Random(semente)
+    vertices = list(range(n))
+    for _ in range(iteracoes):
+        rng.shuffle(vertices)
+        movidos = 0
+        for v in vertices:
+            contagem = {}
+            for w in vizinhos[v]:
+                contagem[dono[w]] = contagem.get(dono[w], 0) + 1
+            atual = dono[v]
+            melhor, melhor_contagem = atual, contagem.get(atual, 0)
+            for parte, c in contagem.items():
+                if c > melhor_contagem and tamanhos[parte] < capacidade:
+                    melhor, melhor_contagem = parte, c
+            if melhor != atual:
+                tamanhos[atual] -= 1
+                tamanhos[melhor] += 1
+                dono[v] = melhor
+                movidos += 1
+        if not movidos:
+            break
+    return dono
+
+
+def _gravar_csr(caminho, globais, inicio, destino, peso):
+    """Grava um bloco CSR (cabeçalho + arrays) em um arquivo binário."""
+    with open(caminho, 'wb') as f:
+        f.write(CABECALHO.pack(len(globais), len(destino)))
+        for dados in (globais, inicio, destino, peso):
+            dados.tofile(f)
+
+
+def salvar_particionado(grafo, pasta, k, **opcoes):
+    """
+    Particiona o grafo e grava os shards e a sobreposição em 'pasta'.
+    :param grafo: Grafo (ou objeto com 'vertices' no mesmo formato), pesos não negativos.
+    :param pasta: Pasta de saída (criada se não existir).
+    :param k: Quantidade de shards.
+    :param opcoes: Repassadas a particionar (iteracoes, desbalanceamento, semente).
+    :return: Lista com o shard de cada vértice.
+    """
+    dono = particionar(grafo, k, **opcoes)
+    nomes = list(grafo.vertices)
+    indice = {v: i for i, v in enumerate(nomes)}
+    membros = [[] for _ in range(k)]
+    for v, p in enumerate(dono):
+        membros[p].append(v)
+    posicao = [0] * len(nomes)
+    for p in range(k):
+        for i, v in enumerate(membros[p]):
+            posicao[v] = i
+
+    os.makedirs(pasta, exist_ok=True)
+    borda = set()
+    cortes = {}   # (u, v) → menor peso entre arestas de shards diferentes
+    arquivos = []
+    for p in range(k):
+        inicio = array('q', [0])
+        destino = array('q')
+        peso = array('d')
+        for u in membros[p]:
+            for (viz, w) in grafo.vertices[nomes[u]]:
+                if w < 0:
+                    raise ValueError("Os pesos devem ser não negativos.")
+                v = indice[viz]
+                destino.append(v)
+                peso.append(w)
+                if dono[v] != p:
+                    borda.add(u)
+                    borda.add(v)
+                    cortes[(u, v)] = min(w, cortes.get((u, v), INF))
+            inicio.append(len(destino))
+        arquivo = f'shard_{p:04d}.bin'
+        _gravar_csr(os.path.join(pasta, arquivo), array('q', membros[p]), inicio, destino, peso)
+        arquivos.append(arquivo)
+
+    with open(os.path.join(pasta, 'dono.bin'), 'wb') as f:
+        array('i', dono).tofile(f)
+    with open(os.path.join(pasta, 'posicao.bin'), 'wb') as f:
+        array('q', posicao).tofile(f)
+    with open(os.path.join(pasta, 'nomes.json'), 'w', encoding='utf-8') as f:
+        json.dump(nomes, f)
+    with open(os.path.join(pasta, 'particao.json'), 'w', encoding='utf-8') as f:
+        json.dump({'n': len(nomes), 'k': k, 'arquivos': arquivos}, f)
+
+    # Sobreposição: para cada vértice de borda, as distâncias (só por dentro do seu
+    # shard) até as outras bordas do shard, mais as arestas de corte que saem dele.
+    # Relê cada shard do disco uma vez só (bordas agrupadas por shard).
+    adjacencia = {b: {} for b in borda}
+    for (u, v), w in cortes.items():
+        adjacencia[u][v] = w
+    with GrafoEmDisco(pasta, max_shards=1) as disco:
+        for b in sorted(borda, key=lambda b: dono[b]):
+            dist, _ = disco._dijkstra_local(dono[b], b)
+            for v, d in dist.items():
+                if v != b and v in borda and d < adjacencia[b].get(v, INF):
+                    adjacencia[b][v] = d
+    globais = array('q', sorted(borda))
+    inicio = array('q', [0])
+    destino = array('q')
+    peso = array('d')
+    for b in globais:
+        for v, d in adjacencia[b].items():
+            destino.append(v)
+            peso.append(d)
+        inicio.append(len(destino))
+    _gravar_csr(os.path.join(pasta, 'sobreposicao.bin'), globais, inicio, destino, peso)
+    return dono
+
+
+class _BlocoCSR:
+    """
+    Um arquivo CSR (shard ou sobreposição) mapeado em memória com mmap.
+    - globais: id global de cada vértice local
+    - inicio, destino, peso: arestas do vértice local i em inicio[i]..inicio[i+1]
+    """
+    def __init__(self, caminho):
+        self._arquivo = open(caminho, 'rb')
+        self._mmap = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        n, m = CABECALHO.unpack_from(self._mmap, 0)
+        self._buffer = memoryview(self._mmap)
+        self._visoes = []
+        pos = CABECALHO.size
+        for nome, tipo, tamanho in (('globais', 'q', n), ('inicio', 'q', n + 1),
+                                    ('destino', 'q', m), ('peso', 'd', m)):
+            visao = self._buffer[pos:pos + 8 * tamanho].cast(tipo)
+            self._visoes.append(visao)
+            setattr(self, nome, visao)
+            pos += 8 * tamanho
+
+    def arestas(self, local):
+        """Lista de (id global do vizinho, peso) do vértice local."""
+        inicio = self.inicio
+        return list(zip(self.destino[inicio[local]:inicio[local + 1]],
+                        self.peso[inicio[local]:inicio[local + 1]]))
+
+    def fechar(self):
+        for visao in self._visoes:
+            visao.release()
+        self._buffer.release()
+        self._mmap.close()
+        self._arquivo.close()
+
+
+class GrafoEmDisco:
+    """
+    Grafo particionado por salvar_particionado, lido do disco sob demanda.
+    - max_shards: quantos shards mantidos mapeados ao mesmo tempo (cache LRU)
+    - carregamentos / acertos: shards abertos do disco / encontrados no cache
+    Vértices são identificados pelo nome (como em Grafo) nas funções públicas.
+    """
+    def __init__(self, pasta, max_shards=4):
+        self.pasta = pasta
+        with open(os.path.join(pasta, 'particao.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        with open(os.path.join(pasta, 'nomes.json'), encoding='utf-8') as f:
+            self.nomes = json.load(f)
+        self.indice = {v: i for i, v in enumerate(self.nomes)}
+        self.dono = array('i')
+        self.posicao = array('q')
+        with open(os.path.join(pasta, 'dono.bin'), 'rb') as f:
+            self.dono.fromfile(f, self.meta['n'])
+        with open(os.path.join(pasta, 'posicao.bin'), 'rb') as f:
+            self.posicao.fromfile(f, self.meta['n'])
+        self.max_shards = max(1, max_shards)
+        self._cache = OrderedDict()
+        self._sobreposicao = None
+        self.carregamentos = 0
+        self.acertos = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def fechar(self):
+        """Desmapeia todos os shards abertos."""
+        while self._cache:
+            self._cache.popitem(last=False)[1].fechar()
+
+    def _shard(self, p):
+        """Retorna o shard p, abrindo-o (e descartando o menos usado) se preciso."""
+        bloco = self._cache.get(p)
+        if bloco is not None:
+            self._cache.move_to_end(p)
+            self.acertos += 1
+            return bloco
+        if len(self._cache) >= self.max_shards:
+            self._cache.popitem(last=False)[1].fechar()
+        bloco = _BlocoCSR(os.path.join(self.pasta, self.meta['arquivos'][p]))
+        self._cache[p] = bloco
+        self.carregamentos += 1
+        return bloco
+
+    def _arestas(self, u):
+        """Arestas (id global, peso) do vértice de id global u."""
+        return self._shard(self.dono[u]).arestas(self.posicao[u])
+
+    def _arestas_sobreposicao(self):
+        """Carrega (uma vez) a sobreposição como dicionário borda → [(borda, distância)]."""
+        if self._sobreposicao is None:
+            bloco = _BlocoCSR(os.path.join(self.pasta, 'sobreposicao.bin'))
+            self._sobreposicao = {b: bloco.arestas(i) for i, b in enumerate(bloco.globais)}
+            bloco.fechar()
+        return self._sobreposicao
+
+    def _dijkstra_local(self, p, origem, alvo=None):
+        """
+        Dijkstra por ids globais usando só as arestas internas do shard p.
+        :return: (dist, prev) apenas com os vértices alcançados.
+        """
+        shard = self._shard(p)
+        dono, posicao = self.dono, self.posicao
+        dist = {origem: 0}
+        prev = {origem: None}
+        fila = [(0, origem)]
+        fechados = set()
+        while fila:
+            d, u = heappop(fila)
+            if u in fechados:
+                continue
+            fechados.add(u)
+            if u == alvo:
+                break
+            for v, w in shard.arestas(posicao[u]):
+                if dono[v] != p or v in fechados:
+                    continue
+                nova = d + w
+                if nova < dist.get(v, INF):
+                    dist[v] = nova
+                    prev[v] = u
+                    heappush(fila, (nova, v))
+        return dist, prev
+
+    def dijkstra(self, inicio):
+        """
+        Dijkstra completo a partir de 'inicio', abrindo os shards conforme a busca avança.
+        :return: (dist, prev) por nome, apenas com os vértices alcançáveis.
+        """
+        s = self.indice[inicio]
+        dist = {s: 0}
+        prev = {s: None}
+        fila = [(0, s)]
+        fechados = set()
+        while fila:
+            d, u = heappop(fila)
+            if u in fechados:
+                continue
+            fechados.add(u)
+            for v, w in self._arestas(u):
+                nova = d + w
+                if v not in fechados and nova < dist.get(v, INF):
+                    dist[v] = nova
+                    prev[v] = u
+                    heappush(fila, (nova, v))
+        nomes = self.nomes
+        return ({nomes[v]: d for v, d in dist.items()},
+                {nomes[v]: (nomes[u] if u is not None else None) for v, u in prev.items()})
+
+    def menor_caminho(self, origem, destino, expandir=True):
+        """
+        Menor caminho entre dois vértices tocando só os shards da origem e do destino:
+        dentro deles a busca usa as arestas reais; fora, só a sobreposição (atalhos
+        borda→borda e arestas de corte). Os atalhos do caminho final são expandidos
+        com buscas locais nos shards por onde ele passa.
+        :param expandir: Se False, não expande os atalhos (o caminho traz só as bordas
+                         por onde a rota passa) e nenhum shard intermediário é lido.
+        :return: (custo, [origem, ..., destino]) ou (inf, None).
+        """
+        s, t = self.indice[origem], self.indice[destino]
+        dono = self.dono
+        locais = {dono[s], dono[t]}
+        sobreposicao = self._arestas_sobreposicao()
+        dist = {s: 0}
+        prev = {s: (None, False)}   # (antecessor, chegou por atalho?)
+        fila = [(0, s)]
+        fechados = set()
+        while fila:
+            d, u = heappop(fila)
+            if u in fechados:
+                continue
+            if u == t:
+                break
+            fechados.add(u)
+            candidatos = []
+            if dono[u] in locais:
+                candidatos.extend((v, w, False) for v, w in self._arestas(u))
+            candidatos.extend((v, w, dono[v] == dono[u]) for v, w in sobreposicao.get(u, ()))
+            for v, w, atalho in candidatos:
+                nova = d + w
+                if v not in fechados and nova < dist.get(v, INF):
+                    dist[v] = nova
+                    prev[v] = (u, atalho)
+                    heappush(fila, (nova, v))
+        if t not in dist:
+            return INF, None
+
+        caminho = [t]
+        v = t
+        while prev[v][0] is not None:
+            u, atalho = prev[v]
+            if atalho and expandir:
+                _, prev_local = self._dijkstra_local(dono[u], u, v)
+                x = prev_local[v]
+                while x != u:
+                    caminho.append(x)
+                    x = prev_local[x]
+            caminho.append(u)
+            v = u
+        return dist[t], [self.nomes[v] for v in reversed(caminho)]
+
+
+if __name__ == '__main__':
+    import importlib.util
+    import tempfile
+
+    # "Dijkstra Oficial.py" tem espaço no nome; importa a classe Grafo pelo caminho
+    caminho = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Dijkstra Oficial.py')
+    spec = importlib.util.spec_from_file_location('dijkstra_oficial', caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+
+    # Grade 30x30 não direcionada com pesos aleatórios
+    rng = random.Random(0)
+    grafo = modulo.Grafo(direcionado=False)
+    lado = 30
+    for i in range(lado * lado):
+        grafo.adicionar_vertice(str(i))
+    for i in range(lado):
+        for j in range(lado):
+            if j + 1 < lado:
+                grafo.adicionar_aresta(str(i * lado + j), str(i * lado + j + 1), rng.randint(1, 9))
+            if i + 1 < lado:
+                grafo.adicionar_aresta(str(i * lado + j), str((i + 1) * lado + j), rng.randint(1, 9))
+
+    with tempfile.TemporaryDirectory() as pasta:
+        salvar_particionado(grafo, pasta, k=9)
+        with GrafoEmDisco(pasta, max_shards=3) as disco:
+            origem, destino = '0', str(lado * lado - 1)
+            custo, bordas = disco.menor_caminho(origem, destino, expandir=False)
+            print(f"Custo {origem}→{destino}: {custo:.0f} ({len(bordas)} vértices sem expandir), "
+                  f"{disco.carregamentos} shards lidos do disco")
+            custo, rota = disco.menor_caminho(origem, destino)
+            print(f"Rota expandida: {len(rota)} vértices, {disco.carregamentos} shards lidos no total")
+            print(f"Dijkstra em memória: {grafo.dijkstra(origem)[0][destino]:.0f}")
@@ -0,0 +1,284 @@
+from bisect import bisect_left, bisect_right
+
+
+# Classe NodeB representa um nó de uma árvore B: as chaves ficam em uma lista
+# ordenada (buscada com bisect) e os filhos em outra lista (vazia nas folhas).
+class NodeB:
+    def __init__(self, keys=None, children=None):
+        self.keys = keys if keys is not None else []          # Chaves ordenadas.
+        self.children = children if children is not None else []  # Filhos (len(keys) + 1).
+        self.size = len(self.keys)  # Quantidade de chaves na subárvore.
+
+    def is_leaf(self):
+        return not self.children
+
+    # Recalcula o tamanho da subárvore a partir dos filhos.
+    def update_size(self):
+        self.size = len(self.keys) + sum(child.size for child in self.children)
+
+
+# Classe rotinaArvoreB implementa a mesma interface de rotinaArvore (trabC_V2.py)
+# sobre uma árvore B. Cada nó guarda até 2t - 1 chaves contíguas, então uma busca
+# toca O(log_t n) nós em vez de O(log2 n) nós encadeados.
+class rotinaArvoreB:
+    def __init__(self, t=32):
+        if t < 2:
+            raise ValueError("O grau mínimo da árvore B deve ser pelo menos 2.")
+        self.t = t        # Grau mínimo: cada nó (exceto a raiz) tem de t-1 a 2t-1 chaves.
+        self.root = None  # Raiz da árvore.
+
+    # Método insert insere um novo valor na árvore (valores repetidos são permitidos).
+    def insert(self, value):
+        if not self.root:
+            self.root = NodeB([value])
+            return
+        if len(self.root.keys) == 2 * self.t - 1:
+            old_root = self.root
+            self.root = NodeB([], [old_root])
+            self._split_child(self.root, 0)
+            self.root.update_size()
+        self._insert_nonfull(self.root, value)
+
+    # Divide o filho i (cheio) de node em dois, subindo a chave do meio.
+    def _split_child(self, node, i):
+        t = self.t
+        child = node.children[i]
+        right = NodeB(child.keys[t:], child.children[t:])
+        middle = child.keys[t - 1]
+        child.keys = child.keys[:t - 1]
+        child.children = child.children[:t]
+        child.update_size()
+        right.update_size()
+        node.keys.insert(i, middle)
+        node.children.insert(i + 1, right)
+
+    # Insere em um nó que não está cheio, dividindo filhos cheios no caminho.
+    def _insert_nonfull(self, node, value):
+        while True:
+            node.size += 1
+            i = bisect_right(node.keys, value)
+            if node.is_leaf():
+                node.keys.insert(i, value)
+                return
+            if len(node.children[i].keys) == 2 * self.t - 1:
+                self._split_child(node, i)
+                if value >= node.keys[i]:
+                    i += 1
+            node = node.children[i]
+
+    # Verifica se um valor está na árvore.
+    def contains(self, value):
+        node = self.root
+        while node:
+            keys = node.keys
+            i = bisect_left(keys, value)
+            if i < len(keys) and keys[i] == value:
+                return True
+            if not node.children:
+                return False
+            node = node.children[i]
+        return False
+
+    # Método delete remove uma ocorrência do valor; retorna True se removeu.
+    def delete(self, value):
+        if not self.contains(value):
+            return False
+        self._delete(self.root, value)
+        if not self.root.keys:
+            self.root = self.root.children[0] if self.root.children else None
+        return True
+
+    # Remoção (algoritmo de Cormen): antes de descer, garante que o filho tem
+    # pelo menos t chaves, para que a remoção nunca deixe um nó abaixo do mínimo.
+    def _delete(self, node, value):
+        t = self.t
+        i = bisect_left(node.keys, value)
+        if i < len(node.keys) and node.keys[i] == value:
+            if node.is_leaf():
+                node.keys.pop(i)
+            elif len(node.children[i].keys) >= t:
+                predecessor = self._max_key(node.children[i])
+                node.keys[i] = predecessor
+                self._delete(node.children[i], predecessor)
+            elif len(node.children[i + 1].keys) >= t:
+                successor = self._min_key(node.children[i + 1])
+                node.keys[i] = successor
+                self._delete(node.children[i + 1], successor)
+            else:
+                self._merge(node, i)
+                self._delete(node.children[i], value)
+        else:
+            if len(node.children[i].keys) == t - 1:
+                if i > 0 and len(node.children[i - 1].keys) >= t:
+                    self._borrow_from_left(node, i)
+                elif i < len(node.keys) and len(node.children[i + 1].keys) >= t:
+                    self._borrow_from_right(node, i)
+                elif i < len(node.keys):
+                    self._merge(node, i)
+                else:
+                    self._merge(node, i - 1)
+                    i -= 1
+            self._delete(node.children[i], value)
+        node.update_size()
+
+    # Junta o filho i, a chave i e o filho i + 1 em um único nó.
+    def _merge(self, node, i):
+        left = node.children[i]
+        right = node.children.pop(i + 1)
+        left.keys.append(node.keys.pop(i))
+        left.keys.extend(right.keys)
+        left.children.extend(right.children)
+        left.update_size()
+
+    # Passa uma chave do irmão esquerdo para o filho i, passando pelo pai.
+    def _borrow_from_left(self, node, i):
+        child = node.children[i]
+        sibling = node.children[i - 1]
+        child.keys.insert(0, node.keys[i - 1])
+        node.keys[i - 1] = sibling.keys.pop()
+        if sibling.children:
+            child.children.insert(0, sibling.children.pop())
+        child.update_size()
+        sibling.update_size()
+
+    # Passa uma chave do irmão direito para o filho i, passando pelo pai.
+    def _borrow_from_right(self, node, i):
+        child = node.children[i]
+        sibling = node.children[i + 1]
+        child.keys.append(node.keys[i])
+        node.keys[i] = sibling.keys.pop(0)
+        if sibling.children:
+            child.children.append(sibling.children.pop(0))
+        child.update_size()
+        sibling.update_size()
+
+    @staticmethod
+    def _max_key(node):
+        while node.children:
+            node = node.children[-1]
+        return node.keys[-1]
+
+    @staticmethod
+    def _min_key(node):
+        while node.children:
+            node = node.children[0]
+        return node.keys[0]
+
+    # Retorna o k-ésimo menor valor (k começa em 1).
+    def select(self, k):
+        if k < 1 or k > (self.root.size if self.root else 0):
+            raise IndexError("k fora do intervalo da árvore.")
+        node = self.root
+        while True:
+            if node.is_leaf():
+                return node.keys[k - 1]
+            for i, child in enumerate(node.children):
+                if k <= child.size:
+                    node = child
+                    break
+                k -= child.size
+                if k == 1:
+                    return node.keys[i]
+                k -= 1
+
+    # Conta os valores menores que x (ou menores ou iguais, se inclusive=True).
+    def _count_less(self, x, inclusive=False):
+        count = 0
+        node = self.root
+        while node:
+            i = bisect_right(node.keys, x) if inclusive else bisect_left(node.keys, x)
+            count += i
+            if node.is_leaf():
+                break
+            count += sum(child.size for child in node.children[:i])
+            node = node.children[i]
+        return count
+
+    # Posição de x: quantidade de valores menores que x.
+    def rank(self, x):
+        return self._count_less(x)
+
+    # Quantidade de valores no intervalo fechado [lo, hi].
+    def count_range(self, lo, hi):
+        if hi < lo:
+            return 0
+        return self._count_less(hi, inclusive=True) - self._count_less(lo)
+
+    # Itera em ordem apenas sobre os valores em [lo, hi].
+    def range(self, lo, hi):
+        if self.root:
+            yield from self._range(self.root, lo, hi)
+
+    def _range(self, node, lo, hi):
+        keys = node.keys
+        i = bisect_left(keys, lo)
+        for j in range(i, len(keys) + 1):
+            if node.children:
+                yield from self._range(node.children[j], lo, hi)
+            if j == len(keys) or keys[j] > hi:
+                return
+            yield keys[j]
+
+    # Percurso Pré-ordem (chaves do nó, depois os filhos).
+    def pre_order(self, node, path=None):
+        path = [] if path is None else path
+        if node:
+            path.extend(node.keys)
+            for child in node.children:
+                self.pre_order(child, path)
+        return path
+
+    # Percurso In-ordem (valores em ordem crescente).
+    def in_order(self, node, path=None):
+        path = [] if path is None else path
+        if node:
+            for i, key in enumerate(node.keys):
+                if node.children:
+                    self.in_order(node.children[i], path)
+                path.append(key)
+            if node.children:
+                self.in_order(node.children[-1], path)
+        return path
+
+    # Percurso Pós-ordem (filhos, depois as chaves do nó).
+    def post_order(self, node, path=None):
+        path = [] if path is None else path
+        if node:
+            for child in node.children:
+                self.post_order(child, path)
+            path.extend(node.keys)
+        return path
+
+    # Calcula a altura da árvore (todas as folhas estão no mesmo nível).
+    def height(self, node):
+        if node is None:
+            return -1
+        h = 0
+        while node.children:
+            node = node.children[0]
+            h += 1
+        return h
+
+    # Uma árvore B não é binária; a classificação de rotinaArvore não se aplica.
+    def tree_type(self):
+        if not self.root:
+            return "Empty Tree"
+        return f"Árvore B (t={self.t})"
+
+    # Conta o número total de valores na árvore.
+    def count_nodes(self):
+        return self.root.size if self.root else 0
+
+
+if __name__ == '__main__':
+    tree = rotinaArvoreB(t=2)
+    for val in [8, 4, 12, 6, 2, 10, 14, 1, 3, 5, 7, 9, 11, 13, 15]:
+        tree.insert(val)
+    print("Percurso In-ordem:", tree.in_order(tree.root))
+    print("Altura:", tree.height(tree.root))
+    print("Tipo:", tree.tree_type())
+    print("5º menor:", tree.select(5))
+    print("Posição de 10:", tree.rank(10))
+    print("Valores em [4, 9]:", tree.count_range(4, 9), list(tree.range(4, 9)))
+    tree.delete(8)
+    print("In-ordem após remover 8:", tree.in_order(tree.root))
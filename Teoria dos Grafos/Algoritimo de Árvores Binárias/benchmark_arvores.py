@@ -0,0 +1,70 @@
+# Compara a árvore binária encadeada (rotinaArvore) com a árvore B
+# (rotinaArvoreB): vazão de buscas e memória por chave.
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+
+from trabC_V2 import rotinaArvore
+from arvore_b import rotinaArvoreB
+
+
+def _inserir(fabrica, valores):
+    arvore = fabrica()
+    for v in valores:
+        arvore.insert(v)
+    return arvore
+
+
+def construir(fabrica, valores):
+    """
+    Constrói uma árvore medindo o tempo e a memória alocada em passadas separadas:
+    o tracemalloc deixa cada alocação bem mais lenta, então o tempo é medido sem ele
+    e a memória numa segunda construção, descartada em seguida.
+    :return: (árvore da passada cronometrada, segundos, bytes alocados).
+    """
+    inicio = time.perf_counter()
+    arvore = _inserir(fabrica, valores)
+    tempo = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    copia = _inserir(fabrica, valores)
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del copia
+    return arvore, tempo, memoria
+
+
+def buscas_por_segundo(arvore, consultas):
+    """Executa contains para cada consulta e retorna a vazão."""
+    inicio = time.perf_counter()
+    for v in consultas:
+        arvore.contains(v)
+    return len(consultas) / (time.perf_counter() - inicio)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark das árvores de índice.")
+    parser.add_argument('-n', type=int, default=200_000, help="Quantidade de chaves.")
+    parser.add_argument('--consultas', type=int, default=200_000)
+    parser.add_argument('--graus', type=int, nargs='+', default=[8, 32, 128],
+                        help="Graus mínimos t da árvore B a testar.")
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    # A inserção da árvore encadeada é recursiva; chaves aleatórias mantêm a altura ~ 2 ln n.
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+    rng = random.Random(args.semente)
+    valores = [rng.randrange(10 * args.n) for _ in range(args.n)]
+    consultas = [rng.randrange(10 * args.n) for _ in range(args.consultas)]
+
+    candidatos = [('encadeada', rotinaArvore)]
+    candidatos += [(f'arvore B t={t}', lambda t=t: rotinaArvoreB(t)) for t in args.graus]
+
+    print(f"{'estrutura':<16}{'altura':>8}{'inserção (s)':>14}{'buscas/s':>14}{'bytes/chave':>13}")
+    for nome, fabrica in candidatos:
+        arvore, tempo, memoria = construir(fabrica, valores)
+        vazao = buscas_por_segundo(arvore, consultas)
+        print(f"{nome:<16}{arvore.height(arvore.root):>8}{tempo:>14.3f}{vazao:>14,.0f}{memoria / args.n:>13.1f}")
@@ -4,21 +4,94 @@ class Node:
         self.value = value  # Armazena o valor do nó.
         self.left = None    # Filho à esquerda.
         self.right = None   # Filho à direita.
+        self.size = 1       # Quantidade de nós na subárvore enraizada neste nó.
+
+    # Cria uma cópia rasa do nó (os filhos continuam compartilhados).
+    def copy(self):
+        node = Node(self.value)
+        node.left = self.left
+        node.right = self.right
+        node.size = self.size
+        return node
+
+# Inserção persistente: retorna uma nova raiz, copiando apenas o caminho da
+# raiz até o ponto de inserção; as subárvores fora do caminho são compartilhadas
+# e nenhum nó existente é alterado.
+def insert_persistent(root, value):
+    if root is None:
+        return Node(value)
+    node = root.copy()
+    node.size += 1
+    if value < node.value:
+        node.left = insert_persistent(node.left, value)
+    else:
+        node.right = insert_persistent(node.right, value)
+    return node
+
+# Remoção persistente de uma ocorrência do valor: retorna a nova raiz
+# (a própria raiz, sem cópias, se o valor não existir).
+def delete_persistent(root, value):
+    if root is None:
+        return None
+    if value < root.value:
+        left = delete_persistent(root.left, value)
+        if left is root.left:
+            return root
+        node = root.copy()
+        node.left = left
+    elif value > root.value:
+        right = delete_persistent(root.right, value)
+        if right is root.right:
+            return root
+        node = root.copy()
+        node.right = right
+    else:
+        if root.left is None:
+            return root.right
+        if root.right is None:
+            return root.left
+        # Dois filhos: o sucessor ocupa o lugar do nó removido (em uma cópia).
+        successor = root.right
+        while successor.left:
+            successor = successor.left
+        node = root.copy()
+        node.value = successor.value
+        node.right = delete_persistent(root.right, successor.value)
+    node.size -= 1
+    return node
 
 # Classe rotinaArvore implementa uma árvore binária com diversos métodos.
+# Com persistent=True, insert e delete nunca alteram nós existentes: cada
+# escrita publica uma nova raiz (uma única atribuição), e leitores que pegaram
+# um snapshot() continuam percorrendo a versão antiga sem precisar de trava.
+# Versões antigas são liberadas pelo coletor quando nenhum leitor as referencia.
+# Apenas um escritor por vez é suportado.
 class rotinaArvore:
-    def __init__(self):
+    def __init__(self, persistent=False):
         self.root = None  # Raiz da árvore.
+        self.persistent = persistent
 
     # Método insert insere um novo valor na árvore.
     def insert(self, value):
-        if not self.root:
+        if self.persistent:
+            self.root = insert_persistent(self.root, value)
+        elif not self.root:
             self.root = Node(value)
         else:
             self._insert_recursive(self.root, value)
 
-    # Método recursivo de inserção.
+    # Retorna uma árvore somente leitura com a versão atual (sem copiar nós).
+    # Só é seguro enquanto a árvore estiver em modo persistente.
+    def snapshot(self):
+        if not self.persistent:
+            raise ValueError("snapshot() exige rotinaArvore(persistent=True).")
+        tree = rotinaArvore(persistent=True)
+        tree.root = self.root
+        return tree
+
+    # Método recursivo de inserção (atualiza o tamanho das subárvores no caminho).
     def _insert_recursive(self, node, value):
+        node.size += 1
         if value < node.value:
             if node.left is None:
                 node.left = Node(value)
@@ -30,6 +103,110 @@ class rotinaArvore:
             else:
                 self._insert_recursive(node.right, value)
 
+    # Verifica se um valor está na árvore.
+    def contains(self, value):
+        node = self.root
+        while node:
+            if value == node.value:
+                return True
+            node = node.left if value < node.value else node.right
+        return False
+
+    # Método delete remove uma ocorrência do valor; retorna True se removeu.
+    def delete(self, value):
+        if self.persistent:
+            root = delete_persistent(self.root, value)
+            removed = root is not self.root
+            self.root = root
+            return removed
+        if not self.contains(value):
+            return False
+        self.root = self._delete_recursive(self.root, value)
+        return True
+
+    # Método recursivo de remoção (o valor existe na subárvore).
+    def _delete_recursive(self, node, value):
+        node.size -= 1
+        if value < node.value:
+            node.left = self._delete_recursive(node.left, value)
+        elif value > node.value:
+            node.right = self._delete_recursive(node.right, value)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # Dois filhos: substitui pelo sucessor (menor valor da subárvore direita).
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.value = successor.value
+            node.right = self._delete_recursive(node.right, successor.value)
+        return node
+
+    # Tamanho de uma subárvore (0 para subárvore vazia).
+    @staticmethod
+    def _size(node):
+        return node.size if node else 0
+
+    # Retorna o k-ésimo menor valor (k começa em 1). Custo O(altura).
+    def select(self, k):
+        if k < 1 or k > self._size(self.root):
+            raise IndexError("k fora do intervalo da árvore.")
+        node = self.root
+        while node:
+            left_size = self._size(node.left)
+            if k <= left_size:
+                node = node.left
+            elif k == left_size + 1:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    # Conta os valores menores que x (ou menores ou iguais, se inclusive=True).
+    def _count_less(self, x, inclusive=False):
+        count = 0
+        node = self.root
+        while node:
+            if node.value < x or (inclusive and node.value == x):
+                count += self._size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    # Posição de x: quantidade de valores menores que x. Custo O(altura).
+    def rank(self, x):
+        return self._count_less(x)
+
+    # Quantidade de valores no intervalo fechado [lo, hi]. Custo O(altura).
+    def count_range(self, lo, hi):
+        if hi < lo:
+            return 0
+        return self._count_less(hi, inclusive=True) - self._count_less(lo)
+
+    # Itera em ordem apenas sobre os valores em [lo, hi], visitando só os nós
+    # necessários: O(altura + quantidade de valores retornados).
+    def range(self, lo, hi):
+        stack = []
+        node = self.root
+        while stack or node:
+            # Desce à esquerda apenas enquanto pode haver valores >= lo.
+            while node:
+                if node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.value > hi:
+                return
+            yield node.value
+            node = node.right
+
     # Percurso Pré-ordem.
     def pre_order(self, node, path=[]):
         if node:
@@ -107,78 +284,100 @@ class rotinaArvore:
         return 1 + self._count_nodes(node.left) + self._count_nodes(node.right)
 
 
-# ------------------------------------------------------------------
-# Exemplo 1: Árvore Binária Completa CORRIGIDA (mas não cheia)
-
-# De acordo com a definição que a estrutura de dados em que todos os níveis, exceto o último, estão totalmente preenchidos 
-# e os nós do último nível estão posicionados o mais à esquerda possível. 
-
-# Estrutura desejada:
-#         4
-#       /   \
-#      2     6
-#     /    
-#    1      
-# Nota: o nó 6 possui apenas o filho à esquerda.
-tree_completa = rotinaArvore()
-values_completa = [4, 2, 6, 1]
-
-# Outros exemplos de completa: [10, 5, 15, 2, 7], [4, 2, 6, 1, 3, 5], [30, 15, 45, 10, 20, 40, 50, 5, 12]
-
-for val in values_completa:
-    tree_completa.insert(val)
-
-# ------------------------------------------------------------------
-# Exemplo 2: Árvore Binária Cheia (perfeita)
-# Estrutura desejada:
-#           8
-#         /   \
-#        4     12
-#       / \   /  \
-#      2   6 10  14
-tree_cheia = rotinaArvore()
-values_cheia = [8, 4, 12, 6, 2, 10, 14]
-for val in values_cheia:
-    tree_cheia.insert(val)
-
-# ------------------------------------------------------------------
-# Exemplo 3: Árvore Binária Estrita (não completa nem cheia)
-#         15
-#        /
-#       10
-#      /  \
-#     5    12
-#             \
-#             13
-tree_estrita = rotinaArvore()
-values_estrita = [15, 10, 5, 12, 13]
-for val in values_estrita:
-    tree_estrita.insert(val)
-
-# ------------------------------------------------------------------
-# Exibindo os resultados:
-
-print("Exemplo de Árvore Binária Completa:")
-print("Percurso Pré-ordem:", tree_completa.pre_order(tree_completa.root, []))
-print("Percurso In-ordem:", tree_completa.in_order(tree_completa.root, []))
-print("Percurso Pós-ordem:", tree_completa.post_order(tree_completa.root, []))
-print("Altura:", tree_completa.height(tree_completa.root))
-print("Tipo:", tree_completa.tree_type())
-
-print("\n" + "-"*50 + "\n")
-
-print("Exemplo de Árvore Binária Cheia:")
-print("Percurso Pré-ordem:", tree_cheia.pre_order(tree_cheia.root, []))
-print("Percurso In-ordem:", tree_cheia.in_order(tree_cheia.root, []))
-print("Percurso Pós-ordem:", tree_cheia.post_order(tree_cheia.root, []))
-print("Altura:", tree_cheia.height(tree_cheia.root))
-print("Tipo:", tree_cheia.tree_type())
-
-print("\n" + "-"*50 + "\n")
-
-print("Exemplo de Árvore Binária Estrita:")
-print("Percurso Pré-ordem:", tree_estrita.pre_order(tree_estrita.root, []))
-print("Percurso In-ordem:", tree_estrita.in_order(tree_estrita.root, []))
-print("Percurso Pós-ordem:", tree_estrita.post_order(tree_estrita.root, []))
-print("Altura:", tree_estrita.height(tree_estrita.root))
-print("Tipo:", tree_estrita.tree_type())
+if __name__ == '__main__':
+    # ------------------------------------------------------------------
+    # Exemplo 1: Árvore Binária Completa CORRIGIDA (mas não cheia)
+
+    # De acordo com a definição que a estrutura de dados em que todos os níveis, exceto o último, estão totalmente preenchidos 
+    # e os nós do último nível estão posicionados o mais à esquerda possível. 
+
+    # Estrutura desejada:
+    #         4
+    #       /   \
+    #      2     6
+    #     /    
+    #    1      
+    # Nota: o nó 6 possui apenas o filho à esquerda.
+    tree_completa = rotinaArvore()
+    values_completa = [4, 2, 6, 1]
+
+    # Outros exemplos de completa: [10, 5, 15, 2, 7], [4, 2, 6, 1, 3, 5], [30, 15, 45, 10, 20, 40, 50, 5, 12]
+
+    for val in values_completa:
+        tree_completa.insert(val)
+
+    # ------------------------------------------------------------------
+    # Exemplo 2: Árvore Binária Cheia (perfeita)
+    # Estrutura desejada:
+    #           8
+    #         /   \
+    #        4     12
+    #       / \   /  \
+    #      2   6 10  14
+    tree_cheia = rotinaArvore()
+    values_cheia = [8, 4, 12, 6, 2, 10, 14]
+    for val in values_cheia:
+        tree_cheia.insert(val)
+
+    # ------------------------------------------------------------------
+    # Exemplo 3: Árvore Binária Estrita (não completa nem cheia)
+    #         15
+    #        /
+    #       10
+    #      /  \
+    #     5    12
+    #             \
+    #             13
+    tree_estrita = rotinaArvore()
+    values_estrita = [15, 10, 5, 12, 13]
+    for val in values_estrita:
+        tree_estrita.insert(val)
+
+    # ------------------------------------------------------------------
+    # Exibindo os resultados:
+
+    print("Exemplo de Árvore Binária Completa:")
+    print("Percurso Pré-ordem:", tree_completa.pre_order(tree_completa.root, []))
+    print("Percurso In-ordem:", tree_completa.in_order(tree_completa.root, []))
+    print("Percurso Pós-ordem:", tree_completa.post_order(tree_completa.root, []))
+    print("Altura:", tree_completa.height(tree_completa.root))
+    print("Tipo:", tree_completa.tree_type())
+
+    print("\n" + "-"*50 + "\n")
+
+    print("Exemplo de Árvore Binária Cheia:")
+    print("Percurso Pré-ordem:", tree_cheia.pre_order(tree_cheia.root, []))
+    print("Percurso In-ordem:", tree_cheia.in_order(tree_cheia.root, []))
+    print("Percurso Pós-ordem:", tree_cheia.post_order(tree_cheia.root, []))
+    print("Altura:", tree_cheia.height(tree_cheia.root))
+    print("Tipo:", tree_cheia.tree_type())
+
+    print("\n" + "-"*50 + "\n")
+
+    print("Exemplo de Árvore Binária Estrita:")
+    print("Percurso Pré-ordem:", tree_estrita.pre_order(tree_estrita.root, []))
+    print("Percurso In-ordem:", tree_estrita.in_order(tree_estrita.root, []))
+    print("Percurso Pós-ordem:", tree_estrita.post_order(tree_estrita.root, []))
+    print("Altura:", tree_estrita.height(tree_estrita.root))
+    print("Tipo:", tree_estrita.tree_type())
+
+    print("\n" + "-"*50 + "\n")
+
+    print("Estatísticas de ordem (Árvore Binária Cheia):")
+    print("3º menor:", tree_cheia.select(3))
+    print("Posição de 10:", tree_cheia.rank(10))
+    print("Valores em [5, 12]:", tree_cheia.count_range(5, 12), list(tree_cheia.range(5, 12)))
+    tree_cheia.delete(4)
+    print("In-ordem após remover 4:", tree_cheia.in_order(tree_cheia.root, []))
+
+    print("\n" + "-"*50 + "\n")
+
+    print("Snapshots persistentes:")
+    tree_persistente = rotinaArvore(persistent=True)
+    for val in values_cheia:
+        tree_persistente.insert(val)
+    versao_1 = tree_persistente.snapshot()
+    tree_persistente.insert(9)
+    tree_persistente.delete(12)
+    print("Versão antiga:", versao_1.in_order(versao_1.root, []))
+    print("Versão atual:", tree_persistente.in_order(tree_persistente.root, []))